@@ -6,6 +6,13 @@ Analyzes database query patterns to recommend optimal MongoDB schema design.
 __version__ = "1.3.0"
 __author__ = "Karthik Raghavan"
 
-from schema_travels.config import get_settings
-
 __all__ = ["__version__", "get_settings"]
+
+
+def __getattr__(name: str):
+    """Import the settings (and pydantic) only when they are first used."""
+    if name == "get_settings":
+        from schema_travels.config import get_settings
+
+        return get_settings
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,33 @@
+"""Interned lowercase identifiers for the analyzers.
+
+The same few hundred table and column names appear in millions of
+queries. Lowercasing each occurrence allocates a new string; caching the
+interned result means every occurrence shares one object, which also
+makes dict lookups keyed on these names cheaper.
+"""
+
+import sys
+
+# Upper bound on distinct names kept; beyond it names are still lowered,
+# just not cached
+LOWER_CACHE_SIZE = 65536
+
+_LOWER_CACHE: dict[str, str] = {}
+
+
+def lower_name(name: str) -> str:
+    """
+    Lowercase an identifier, returning a shared interned string.
+
+    Args:
+        name: Table or column name as written in the query
+
+    Returns:
+        Lowercased, interned name
+    """
+    lowered = _LOWER_CACHE.get(name)
+    if lowered is None:
+        lowered = sys.intern(name.lower())
+        if len(_LOWER_CACHE) < LOWER_CACHE_SIZE:
+            _LOWER_CACHE[name] = lowered
+    return lowered
@@ -0,0 +1,31 @@
+"""Process-pool helpers for splitting analyzer work across cores."""
+
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from typing import TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def map_chunks(
+    worker: Callable[[Sequence[T]], R],
+    items: Sequence[T],
+    workers: int,
+) -> list[R]:
+    """
+    Run a worker over contiguous chunks of items in a process pool.
+
+    Args:
+        worker: Module-level (picklable) function applied to each chunk
+        items: Items to split into one chunk per worker
+        workers: Number of worker processes
+
+    Returns:
+        Worker results, in the same order as the chunks
+    """
+    chunk_size = -(-len(items) // workers)
+    chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+    with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+        return list(executor.map(worker, chunks))
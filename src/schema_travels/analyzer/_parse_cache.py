@@ -0,0 +1,79 @@
+"""Shared SQL parse cache for the analyzers.
+
+Query logs repeat the same statement templates thousands of times, so
+parsing is memoized on the SQL text. Literals are replaced with
+placeholders first: the analyzers only look at tables, joins and columns,
+never at literal values. The cached ASTs are shared between callers and
+must be treated as read-only.
+"""
+
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+import sqlglot
+from sqlglot import exp
+
+PARSE_CACHE_SIZE = 4096
+
+# String literals, quoted identifiers and numbers, matched in one pass.
+# A string may contain doubled quotes ('it''s'); a backslash is an
+# ordinary character, as in standard SQL. Quoted identifiers are matched
+# only so that digits inside them ("sales 2024") are left alone.
+_LITERAL_RE = re.compile(
+    r"(?P<string>'(?:[^']|'')*')"
+    r'|(?P<ident>"(?:[^"]|"")*"|`[^`]*`)'
+    r"|(?P<number>\b\d+(?:\.\d+)?\b)"
+)
+_LITERAL_REPL = {"string": "'?'", "number": "0"}
+
+
+def parse_sql(sql: str) -> exp.Expression | None:
+    """
+    Parse a SQL statement, reusing the AST for previously seen SQL.
+
+    Args:
+        sql: Raw SQL text
+
+    Returns:
+        Parsed expression, or None if the SQL could not be parsed
+    """
+    return _parse_cached(_normalize(sql))
+
+
+def parse_many(sqls: list[str], threads: int) -> list[exp.Expression | None]:
+    """
+    Parse many SQL statements using a thread pool.
+
+    Only pays off when the sqlglot tokenizer/parser releases the GIL
+    (compiled backend); results are in the same order as the input.
+
+    Args:
+        sqls: Raw SQL texts
+        threads: Number of parser threads
+
+    Returns:
+        Parsed expressions (None where parsing failed)
+    """
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        return list(executor.map(parse_sql, sqls))
+
+
+def _normalize(sql: str) -> str:
+    """Replace literals with placeholders and collapse whitespace."""
+    normalized = _LITERAL_RE.sub(_replace_literal, sql)
+    return " ".join(normalized.split())
+
+
+def _replace_literal(match: re.Match[str]) -> str:
+    """Placeholder for a matched literal; quoted identifiers are kept."""
+    return _LITERAL_REPL.get(match.lastgroup, match.group())
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_cached(sql: str) -> exp.Expression | None:
+    """Parse normalized SQL (failures are cached as None)."""
+    try:
+        return sqlglot.parse_one(sql)
+    except Exception:
+        return None
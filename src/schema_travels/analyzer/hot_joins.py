@@ -1,105 +1,172 @@
 """Hot joins analyzer - identifies frequently executed, expensive JOINs."""
 
+import heapq
+import re
 from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from operator import attrgetter
 from typing import Any
 
-import sqlglot
 from sqlglot import exp
 
 from schema_travels.collector.models import QueryLog
+from schema_travels.analyzer._parallel import map_chunks
+from schema_travels.analyzer._names import lower_name
+from schema_travels.analyzer._parse_cache import parse_many, parse_sql
 from schema_travels.analyzer.models import JoinPattern, TableStatistics
 
+# Cheap prefilter for single-table SELECTs, which need no full parse
+_SELECT_RE = re.compile(r"^\s*SELECT\b", re.IGNORECASE)
+_JOIN_RE = re.compile(r"\bJOIN\b", re.IGNORECASE)
+_FROM_KEYWORD_RE = re.compile(r"\bFROM\b", re.IGNORECASE)
+_FROM_TABLE_RE = re.compile(
+    r"\bFROM\s+(?:[A-Za-z_]\w*\s*\.\s*)*(?P<table>[A-Za-z_]\w*)"
+    r"(?:\s+(?:AS\s+)?[A-Za-z_]\w*)?",
+    re.IGNORECASE,
+)
+
+_IGNORED_TABLES = ("dual", "sysibm.sysdummy1")
+
 
 class HotJoinAnalyzer:
     """Analyzes query logs to identify hot (frequent + expensive) JOINs."""
 
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize the analyzer."""
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Discard all collected counts so the analyzer can be reused.
+
+        Fresh containers are created rather than cleared in place, so
+        results returned by earlier analyze() calls stay intact.
+        """
         self.join_patterns: dict[tuple[str, str], JoinPattern] = {}
         self.table_stats: dict[str, TableStatistics] = {}
         self._queries_processed = 0
 
-    def analyze(self, queries: list[QueryLog]) -> list[JoinPattern]:
+    def analyze(
+        self, queries: list[QueryLog], workers: int = 1, threads: int = 1
+    ) -> list[JoinPattern]:
         """
         Analyze queries and return hot join patterns.
 
         Args:
             queries: List of query logs to analyze
+            workers: Number of processes to split the queries across
+                     (1 = analyze in this process)
+            threads: Number of threads used to parse the queries up front
+                     when analyzing in this process (1 = parse inline)
 
         Returns:
             List of join patterns sorted by cost score (descending)
         """
-        for query in queries:
-            self._process_query(query)
+        if workers > 1 and len(queries) > workers:
+            for chunk_result in map_chunks(_analyze_chunk, queries, workers):
+                self.merge(chunk_result)
+        elif threads > 1:
+            parsed_queries = parse_many([query.sql for query in queries], threads)
+            return self.analyze_parsed(zip(queries, parsed_queries, strict=True))
+        else:
+            for query in queries:
+                self._process_query(query)
+
+        return self._ranked_joins()
+
+    def analyze_parsed(
+        self, parsed_queries: Iterable[tuple[QueryLog, exp.Expression | None]]
+    ) -> list[JoinPattern]:
+        """
+        Analyze queries that have already been parsed.
 
-        # Sort by cost score
-        hot_joins = sorted(
+        Args:
+            parsed_queries: (query, parsed expression or None) pairs
+
+        Returns:
+            List of join patterns sorted by cost score (descending)
+        """
+        # The ASTs are used as given; the regex prefilter is only a
+        # substitute for parsing, never for a parse that already happened
+        for query, parsed in parsed_queries:
+            self._process_parsed(parsed, query.duration_ms or 0)
+        return self._ranked_joins()
+
+    def _ranked_joins(self) -> list[JoinPattern]:
+        """All join patterns sorted by cost score (descending)."""
+        return sorted(
             self.join_patterns.values(),
-            key=lambda j: j.cost_score,
+            key=attrgetter("cost_score"),
             reverse=True,
         )
 
-        return hot_joins
-
     def _process_query(self, query: QueryLog) -> None:
         """Process a single query and extract join patterns."""
+        duration = query.duration_ms or 0
+
+        table = _single_table(query.sql)
+        if table is not None:
+            self._queries_processed += 1
+            self._record_solo_access(table, duration)
+            return
+
+        self._process_parsed(parse_sql(query.sql), duration)
+
+    def _process_parsed(self, parsed: exp.Expression | None, duration: float) -> None:
+        """Extract join patterns from an already-parsed query."""
         self._queries_processed += 1
 
-        try:
-            parsed = sqlglot.parse_one(query.sql)
-        except Exception:
+        if parsed is None:
             return  # Skip unparseable queries
 
-        # Extract tables
-        tables = self._extract_tables(parsed)
+        # Collect tables and joins in a single tree walk
+        table_names: set[str] = set()
+        join_exprs = []
+        for node in parsed.find_all(exp.Table, exp.Join):
+            if isinstance(node, exp.Join):
+                join_exprs.append(node)
+            elif isinstance(node, exp.Table):
+                name = self._table_name(node)
+                if name:
+                    table_names.add(name)
+        tables = list(table_names)
 
         # Update table statistics
-        duration = query.duration_ms or 0
-
         if len(tables) == 1:
-            # Solo access
-            table = tables[0]
-            self._ensure_table_stats(table)
-            self.table_stats[table].solo_accesses += 1
-            self.table_stats[table].total_accesses += 1
-            self.table_stats[table].total_time_ms += duration
+            self._record_solo_access(tables[0], duration)
         else:
             # Joined access
+            share = duration / len(tables) if tables else 0.0
             for table in tables:
-                self._ensure_table_stats(table)
-                self.table_stats[table].joined_accesses += 1
-                self.table_stats[table].total_accesses += 1
-                self.table_stats[table].total_time_ms += duration / len(tables)
+                stats = self._table_stats_for(table)
+                stats.joined_accesses += 1
+                stats.total_accesses += 1
+                stats.total_time_ms += share
 
         # Extract join patterns
-        joins = self._extract_joins(parsed)
-        for join_info in joins:
-            self._record_join(join_info, duration)
-
-    def _extract_tables(self, parsed: exp.Expression) -> list[str]:
-        """Extract all table names from a parsed query."""
-        tables = []
-        for table_expr in parsed.find_all(exp.Table):
-            if hasattr(table_expr, "name") and table_expr.name:
-                # Skip common aliases and subqueries
-                name = table_expr.name.lower()
-                if name not in ("dual", "sysibm.sysdummy1"):
-                    tables.append(name)
-        return list(set(tables))
-
-    def _extract_joins(self, parsed: exp.Expression) -> list[dict[str, Any]]:
-        """Extract join information from parsed query."""
-        joins = []
-
-        for join_expr in parsed.find_all(exp.Join):
-            join_info = self._parse_join(join_expr, parsed)
+        for join_expr in join_exprs:
+            join_info = self._parse_join(join_expr, tables)
             if join_info:
-                joins.append(join_info)
-
-        return joins
+                self._record_join(join_info, duration)
+
+    def _table_name(self, table_expr: exp.Table) -> str | None:
+        """Get the lowercased name of a table reference, if it is a real table."""
+        if hasattr(table_expr, "name") and table_expr.name:
+            # Skip common aliases and subqueries
+            name = lower_name(table_expr.name)
+            if name not in _IGNORED_TABLES:
+                return name
+        return None
+
+    def _record_solo_access(self, table: str, duration: float) -> None:
+        """Record a query that touched only one table."""
+        stats = self._table_stats_for(table)
+        stats.solo_accesses += 1
+        stats.total_accesses += 1
+        stats.total_time_ms += duration
 
     def _parse_join(
-        self, join_expr: exp.Join, full_query: exp.Expression
+        self, join_expr: exp.Join, query_tables: list[str]
     ) -> dict[str, Any] | None:
         """Parse a JOIN expression to extract details."""
         try:
@@ -113,7 +180,7 @@ class HotJoinAnalyzer:
             # Get right table
             right_table = None
             if hasattr(join_expr.this, "name"):
-                right_table = join_expr.this.name.lower()
+                right_table = lower_name(join_expr.this.name)
             elif hasattr(join_expr.this, "alias"):
                 # Subquery with alias
                 return None
@@ -134,8 +201,8 @@ class HotJoinAnalyzer:
                     col2 = columns[1]
 
                     # Determine which column belongs to which table
-                    col1_table = col1.table.lower() if col1.table else ""
-                    col2_table = col2.table.lower() if col2.table else ""
+                    col1_table = lower_name(col1.table) if col1.table else ""
+                    col2_table = lower_name(col2.table) if col2.table else ""
 
                     if col1_table == right_table:
                         right_col = col1.name
@@ -153,10 +220,10 @@ class HotJoinAnalyzer:
 
             # If we couldn't find left table, try to infer from FROM clause
             if not left_table:
-                all_tables = self._extract_tables(full_query)
-                other_tables = [t for t in all_tables if t != right_table]
-                if other_tables:
-                    left_table = other_tables[0]
+                # At most two probes: the first table that isn't the right one
+                left_table = next(
+                    (t for t in query_tables if t != right_table), None
+                )
 
             if not left_table:
                 return None
@@ -175,7 +242,8 @@ class HotJoinAnalyzer:
     def _record_join(self, join_info: dict[str, Any], duration_ms: float) -> None:
         """Record a join occurrence."""
         # Use sorted tuple as key for consistent lookup
-        key = tuple(sorted([join_info["left_table"], join_info["right_table"]]))
+        left, right = join_info["left_table"], join_info["right_table"]
+        key = (left, right) if left <= right else (right, left)
 
         if key not in self.join_patterns:
             self.join_patterns[key] = JoinPattern(
@@ -189,30 +257,114 @@ class HotJoinAnalyzer:
         pattern.frequency += 1
         pattern.total_time_ms += duration_ms
         pattern.avg_time_ms = pattern.total_time_ms / pattern.frequency
+        pattern.cost_score = pattern.frequency * pattern.avg_time_ms
+
+    def merge(self, other: "HotJoinAnalyzer") -> None:
+        """
+        Fold another analyzer's counts into this one.
+
+        Args:
+            other: Analyzer that processed a disjoint set of queries
+        """
+        for key, theirs in other.join_patterns.items():
+            pattern = self.join_patterns.get(key)
+            if pattern is None:
+                self.join_patterns[key] = theirs
+                continue
+            pattern.frequency += theirs.frequency
+            pattern.total_time_ms += theirs.total_time_ms
+            pattern.avg_time_ms = pattern.total_time_ms / pattern.frequency
+            pattern.cost_score = pattern.frequency * pattern.avg_time_ms
+
+        for table, their_stats in other.table_stats.items():
+            stats = self.table_stats.get(table)
+            if stats is None:
+                self.table_stats[table] = their_stats
+                continue
+            stats.total_accesses += their_stats.total_accesses
+            stats.solo_accesses += their_stats.solo_accesses
+            stats.joined_accesses += their_stats.joined_accesses
+            stats.total_time_ms += their_stats.total_time_ms
+
+        self._queries_processed += other._queries_processed
+
+    def warm(self, tables: Iterable[str]) -> None:
+        """
+        Create empty statistics for known tables up front.
+
+        Tables that are never queried keep zero counts and are still
+        reported by get_table_statistics().
+
+        Args:
+            tables: Table names, e.g. from the parsed schema
+        """
+        for table in tables:
+            self._table_stats_for(lower_name(table))
 
-    def _ensure_table_stats(self, table: str) -> None:
-        """Ensure table statistics entry exists."""
-        if table not in self.table_stats:
-            self.table_stats[table] = TableStatistics(table=table)
+    def _table_stats_for(self, table: str) -> TableStatistics:
+        """Get the statistics entry for a table, creating it if needed."""
+        stats = self.table_stats.get(table)
+        if stats is None:
+            stats = self.table_stats[table] = TableStatistics(table=table)
+        return stats
 
     def get_table_statistics(self) -> list[TableStatistics]:
         """Get statistics for all tables."""
         return list(self.table_stats.values())
 
+    def get_table_statistics_map(self) -> dict[str, TableStatistics]:
+        """Get statistics keyed by table name (the live dict, not a copy)."""
+        return self.table_stats
+
     def get_hot_joins(self, top_n: int = 20) -> list[JoinPattern]:
         """Get top N hot joins by cost score."""
-        sorted_joins = sorted(
-            self.join_patterns.values(),
-            key=lambda j: j.cost_score,
-            reverse=True,
+        return heapq.nlargest(
+            top_n, self.join_patterns.values(), key=attrgetter("cost_score")
         )
-        return sorted_joins[:top_n]
 
     def get_co_access_matrix(self) -> dict[tuple[str, str], int]:
-        """Get co-access frequency matrix for all table pairs."""
+        """Get co-access frequency matrix keyed on sorted table pairs."""
         return {key: pattern.frequency for key, pattern in self.join_patterns.items()}
 
     @property
     def queries_processed(self) -> int:
         """Number of queries processed."""
         return self._queries_processed
+
+
+def _single_table(sql: str) -> str | None:
+    """
+    Return the table of a plain single-table SELECT without parsing it.
+
+    Only matches a SELECT with exactly one FROM, no JOIN and no comma
+    join; anything else (subqueries, CTEs, unions, quoted names, table
+    functions, unbalanced parentheses or quotes) returns None so the
+    caller falls back to a full parse.
+    """
+    if _JOIN_RE.search(sql) or not _SELECT_RE.match(sql):
+        return None
+    if len(_FROM_KEYWORD_RE.findall(sql)) != 1:
+        return None
+    # SQL a parse would reject must not be counted
+    if sql.count("(") != sql.count(")") or sql.count("'") % 2 or sql.count('"') % 2:
+        return None
+
+    match = _FROM_TABLE_RE.search(sql)
+    if match is None or sql[match.end():].lstrip().startswith(","):
+        return None
+    # A table function call or a further name part is not a plain table
+    if sql[match.end("table"):].lstrip().startswith((".", "(")):
+        return None
+
+    table = lower_name(match.group("table"))
+    if table in _IGNORED_TABLES:
+        return None
+    return table
+
+
+def _analyze_chunk(queries: Sequence[QueryLog]) -> HotJoinAnalyzer:
+    """Process-pool worker: analyze one chunk of queries."""
+    analyzer = HotJoinAnalyzer()
+    for query in queries:
+        analyzer._process_query(query)
+    return analyzer
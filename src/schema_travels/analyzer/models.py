@@ -1,11 +1,18 @@
 """Data models for the analyzer module."""
 
+import heapq
 from dataclasses import dataclass, field
 from datetime import datetime
+from operator import attrgetter
 from typing import Any
 
 
-@dataclass
+def _sorted_pair(a: str, b: str) -> tuple[str, str]:
+    """Order two table names without building a temporary list."""
+    return (a, b) if a <= b else (b, a)
+
+
+@dataclass(slots=True)
 class JoinPattern:
     """Represents a frequently occurring JOIN pattern."""
 
@@ -16,16 +23,16 @@ class JoinPattern:
     frequency: int = 0
     total_time_ms: float = 0.0
     avg_time_ms: float = 0.0
+    # Higher score = more impactful to optimize (frequency * avg_time_ms).
+    # Stored rather than computed so sorting doesn't pay for it per compare.
+    cost_score: float = field(default=0.0, init=False)
+    # Sorted table pair for consistent comparison
+    table_pair: tuple[str, str] = field(init=False, repr=False, compare=False)
 
-    @property
-    def cost_score(self) -> float:
-        """Higher score = more impactful to optimize."""
-        return self.frequency * self.avg_time_ms
-
-    @property
-    def table_pair(self) -> tuple[str, str]:
-        """Get sorted table pair for consistent comparison."""
-        return tuple(sorted([self.left_table, self.right_table]))
+    def __post_init__(self) -> None:
+        """Compute the initial cost score and the sorted table pair."""
+        self.cost_score = self.frequency * self.avg_time_ms
+        self.table_pair = _sorted_pair(self.left_table, self.right_table)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -41,7 +48,7 @@ class JoinPattern:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class MutationPattern:
     """Represents read/write patterns for a table."""
 
@@ -104,7 +111,7 @@ class MutationPattern:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class AccessPattern:
     """Represents co-access patterns between tables."""
 
@@ -113,31 +120,25 @@ class AccessPattern:
     co_access_count: int = 0
     table_a_solo_count: int = 0
     table_b_solo_count: int = 0
+    # Sorted table pair
+    table_pair: tuple[str, str] = field(init=False, repr=False, compare=False)
+    # Ratios are stored rather than computed so sorting and the embedding
+    # rules read plain attributes.
+    # co_access_ratio: co-accesses relative to the less-accessed table
+    co_access_ratio: float = field(default=0.0, init=False)
+    # How often table_a / table_b is accessed alone
+    table_a_independence: float = field(default=0.0, init=False)
+    table_b_independence: float = field(default=0.0, init=False)
+
+    def __post_init__(self) -> None:
+        """Compute the sorted table pair and the access ratios."""
+        self.table_pair = _sorted_pair(self.table_a, self.table_b)
 
-    @property
-    def table_pair(self) -> tuple[str, str]:
-        """Get sorted table pair."""
-        return tuple(sorted([self.table_a, self.table_b]))
-
-    @property
-    def co_access_ratio(self) -> float:
-        """Ratio of co-accesses to total accesses of either table."""
         total_a = self.co_access_count + self.table_a_solo_count
         total_b = self.co_access_count + self.table_b_solo_count
-        min_total = min(total_a, total_b)
-        return self.co_access_count / max(min_total, 1)
-
-    @property
-    def table_a_independence(self) -> float:
-        """How often table_a is accessed alone."""
-        total = self.co_access_count + self.table_a_solo_count
-        return self.table_a_solo_count / max(total, 1)
-
-    @property
-    def table_b_independence(self) -> float:
-        """How often table_b is accessed alone."""
-        total = self.co_access_count + self.table_b_solo_count
-        return self.table_b_solo_count / max(total, 1)
+        self.co_access_ratio = self.co_access_count / max(min(total_a, total_b), 1)
+        self.table_a_independence = self.table_a_solo_count / max(total_a, 1)
+        self.table_b_independence = self.table_b_solo_count / max(total_b, 1)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -153,7 +154,7 @@ class AccessPattern:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TableStatistics:
     """Statistics about a table's usage."""
 
@@ -184,7 +185,7 @@ class TableStatistics:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     """Complete result of query pattern analysis."""
 
@@ -205,6 +206,12 @@ class AnalysisResult:
     hot_joins_count: int = 0
     embedding_candidates_count: int = 0
 
+    def top_mutations(self, n: int = 10) -> list[MutationPattern]:
+        """Get the N mutation patterns with the most operations."""
+        return heapq.nlargest(
+            n, self.mutation_patterns, key=attrgetter("total_operations")
+        )
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
@@ -1,92 +1,165 @@
 """Mutation analyzer - tracks read/write patterns per table."""
 
-from collections import defaultdict
+import heapq
+from collections import Counter
+from collections.abc import Callable, Iterable, Sequence
+from operator import itemgetter
+from typing import Any
 
-import sqlglot
 from sqlglot import exp
 
 from schema_travels.collector.models import QueryLog, QueryType
+from schema_travels.analyzer._parallel import map_chunks
+from schema_travels.analyzer._names import lower_name
+from schema_travels.analyzer._parse_cache import parse_many, parse_sql
 from schema_travels.analyzer.models import MutationPattern
 
 
 class MutationAnalyzer:
     """Analyzes query logs to track read/write patterns per table."""
 
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize the analyzer."""
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Discard all collected counts so the analyzer can be reused.
+
+        Fresh containers are created rather than cleared in place, so
+        results returned by earlier analyze() calls stay intact.
+        """
         self.patterns: dict[str, MutationPattern] = {}
-        self.updated_columns: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
-        self.filtered_columns: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        # Column counts keyed on (table, column)
+        self.updated_columns: Counter[tuple[str, str]] = Counter()
+        self.filtered_columns: Counter[tuple[str, str]] = Counter()
         self._queries_processed = 0
 
-    def analyze(self, queries: list[QueryLog]) -> dict[str, MutationPattern]:
+    def analyze(
+        self, queries: list[QueryLog], workers: int = 1, threads: int = 1
+    ) -> dict[str, MutationPattern]:
         """
         Analyze queries and return mutation patterns per table.
 
         Args:
             queries: List of query logs to analyze
+            workers: Number of processes to split the queries across
+                     (1 = analyze in this process)
+            threads: Number of threads used to parse the queries up front
+                     when analyzing in this process (1 = parse inline)
 
         Returns:
             Dictionary mapping table names to mutation patterns
         """
-        for query in queries:
-            self._process_query(query)
+        if workers > 1 and len(queries) > workers:
+            for chunk_result in map_chunks(_analyze_chunk, queries, workers):
+                self.merge(chunk_result)
+        elif threads > 1:
+            parsed_queries = parse_many([query.sql for query in queries], threads)
+            return self.analyze_parsed(zip(queries, parsed_queries, strict=True))
+        else:
+            for query in queries:
+                self._process_query(query)
+
+        return self.patterns
 
+    def analyze_parsed(
+        self, parsed_queries: Iterable[tuple[QueryLog, exp.Expression | None]]
+    ) -> dict[str, MutationPattern]:
+        """
+        Analyze queries that have already been parsed.
+
+        Args:
+            parsed_queries: (query, parsed expression or None) pairs
+
+        Returns:
+            Dictionary mapping table names to mutation patterns
+        """
+        for query, parsed in parsed_queries:
+            self._process_parsed(parsed, query.duration_ms or 0)
         return self.patterns
 
     def _process_query(self, query: QueryLog) -> None:
         """Process a single query and update mutation patterns."""
-        self._queries_processed += 1
-        duration = query.duration_ms or 0
+        self._process_parsed(parse_sql(query.sql), query.duration_ms or 0)
 
-        try:
-            parsed = sqlglot.parse_one(query.sql)
-        except Exception:
-            return  # Skip unparseable queries
+    def _process_parsed(self, parsed: exp.Expression | None, duration: float) -> None:
+        """Update mutation patterns from an already-parsed query."""
+        self._queries_processed += 1
 
         if parsed is None:
-            return
+            return  # Skip unparseable queries
 
         # Dispatch based on statement type
-        stmt_type = type(parsed).__name__
-
-        if isinstance(parsed, exp.Select):
-            self._process_select(parsed, duration)
-        elif isinstance(parsed, exp.Insert):
-            self._process_insert(parsed, duration)
-        elif isinstance(parsed, exp.Update):
-            self._process_update(parsed, duration)
-        elif isinstance(parsed, exp.Delete):
-            self._process_delete(parsed, duration)
-
-    def _ensure_pattern(self, table: str) -> None:
-        """Ensure mutation pattern exists for table."""
-        table = table.lower()
-        if table not in self.patterns:
-            self.patterns[table] = MutationPattern(table=table)
-
-    def _get_table_name(self, expr) -> str | None:
+        handler = _HANDLERS.get(type(parsed))
+        if handler is not None:
+            handler(self, parsed, duration)
+
+    def merge(self, other: "MutationAnalyzer") -> None:
+        """
+        Fold another analyzer's counts into this one.
+
+        Args:
+            other: Analyzer that processed a disjoint set of queries
+        """
+        for table, theirs in other.patterns.items():
+            pattern = self.patterns.get(table)
+            if pattern is None:
+                self.patterns[table] = theirs
+                continue
+            pattern.select_count += theirs.select_count
+            pattern.insert_count += theirs.insert_count
+            pattern.update_count += theirs.update_count
+            pattern.delete_count += theirs.delete_count
+            pattern.total_time_ms += theirs.total_time_ms
+
+        self.updated_columns.update(other.updated_columns)
+        self.filtered_columns.update(other.filtered_columns)
+
+        self._queries_processed += other._queries_processed
+
+    def warm(self, tables: Iterable[str]) -> None:
+        """
+        Create empty mutation patterns for known tables up front.
+
+        Tables that are never queried keep zero counts and are still
+        included in the returned patterns.
+
+        Args:
+            tables: Table names, e.g. from the parsed schema
+        """
+        for table in tables:
+            self._pattern_for(lower_name(table))
+
+    def _pattern_for(self, table: str) -> MutationPattern:
+        """Get the mutation pattern for a (lowercased) table, creating it if needed."""
+        pattern = self.patterns.get(table)
+        if pattern is None:
+            pattern = self.patterns[table] = MutationPattern(table=table)
+        return pattern
+
+    def _get_table_name(self, expr: Any) -> str | None:
         """Extract table name from various expression types."""
         if expr is None:
             return None
             
         # Direct name attribute
         if hasattr(expr, "name") and expr.name:
-            return expr.name.lower()
+            return lower_name(expr.name)
         
         # Table expression
         if isinstance(expr, exp.Table):
             if hasattr(expr, "name") and expr.name:
-                return expr.name.lower()
+                return lower_name(expr.name)
         
         # Check .this attribute
         if hasattr(expr, "this"):
             if hasattr(expr.this, "name") and expr.this.name:
-                return expr.this.name.lower()
+                return lower_name(expr.this.name)
             if isinstance(expr.this, exp.Table):
                 return self._get_table_name(expr.this)
             if isinstance(expr.this, str):
-                return expr.this.lower()
+                return lower_name(expr.this)
         
         # String conversion as last resort
         try:
@@ -102,10 +175,11 @@ class MutationAnalyzer:
         """Process a SELECT query."""
         tables = self._extract_tables(parsed)
 
+        share = duration / len(tables) if tables else 0.0
         for table in tables:
-            self._ensure_pattern(table)
-            self.patterns[table].select_count += 1
-            self.patterns[table].total_time_ms += duration / len(tables)
+            pattern = self._pattern_for(table)
+            pattern.select_count += 1
+            pattern.total_time_ms += share
 
         # Track filtered columns (from WHERE clause)
         self._extract_filtered_columns(parsed, tables)
@@ -123,9 +197,9 @@ class MutationAnalyzer:
                     break
         
         if table:
-            self._ensure_pattern(table)
-            self.patterns[table].insert_count += 1
-            self.patterns[table].total_time_ms += duration
+            pattern = self._pattern_for(table)
+            pattern.insert_count += 1
+            pattern.total_time_ms += duration
 
     def _process_update(self, parsed: exp.Update, duration: float) -> None:
         """Process an UPDATE query."""
@@ -139,9 +213,9 @@ class MutationAnalyzer:
                     break
         
         if table:
-            self._ensure_pattern(table)
-            self.patterns[table].update_count += 1
-            self.patterns[table].total_time_ms += duration
+            pattern = self._pattern_for(table)
+            pattern.update_count += 1
+            pattern.total_time_ms += duration
 
             # Track updated columns
             self._extract_updated_columns(parsed, table)
@@ -161,79 +235,78 @@ class MutationAnalyzer:
                     break
         
         if table:
-            self._ensure_pattern(table)
-            self.patterns[table].delete_count += 1
-            self.patterns[table].total_time_ms += duration
+            pattern = self._pattern_for(table)
+            pattern.delete_count += 1
+            pattern.total_time_ms += duration
 
             # Track filtered columns
             self._extract_filtered_columns(parsed, [table])
 
     def _extract_tables(self, parsed: exp.Expression) -> list[str]:
         """Extract all table names from a query."""
-        tables = []
+        tables: set[str] = set()
         for table_expr in parsed.find_all(exp.Table):
             name = self._get_table_name(table_expr)
             if name:
-                tables.append(name)
-        return list(set(tables))
+                tables.add(name)
+        return list(tables)
 
     def _extract_updated_columns(self, parsed: exp.Update, table: str) -> None:
         """Extract columns being updated."""
-        # Find SET expressions
-        for eq in parsed.find_all(exp.EQ):
+        # Only the SET list; EQ nodes in WHERE are filters, not updates
+        for eq in parsed.args.get("expressions") or []:
             # Left side of EQ in SET clause is the column being updated
-            if hasattr(eq.this, "name"):
-                col_name = eq.this.name.lower()
-                self.updated_columns[table][col_name] += 1
+            if isinstance(eq, exp.EQ) and hasattr(eq.this, "name"):
+                col_name = lower_name(eq.this.name)
+                self.updated_columns[(table, col_name)] += 1
 
     def _extract_filtered_columns(
         self, parsed: exp.Expression, tables: list[str]
     ) -> None:
         """Extract columns used in WHERE clauses."""
-        where_clause = parsed.find(exp.Where)
+        where_clause = parsed.args.get("where")
         if not where_clause:
             return
 
         for column in where_clause.find_all(exp.Column):
-            col_name = column.name.lower() if hasattr(column, "name") else None
+            col_name = lower_name(column.name) if hasattr(column, "name") else None
             if not col_name:
                 continue
 
             # Try to determine which table the column belongs to
-            col_table = column.table.lower() if column.table else None
+            col_table = lower_name(column.table) if column.table else None
 
             if col_table and col_table in tables:
-                self.filtered_columns[col_table][col_name] += 1
+                self.filtered_columns[(col_table, col_name)] += 1
             elif len(tables) == 1:
                 # If only one table, assume column belongs to it
-                self.filtered_columns[tables[0]][col_name] += 1
+                self.filtered_columns[(tables[0], col_name)] += 1
 
     def get_mutation_report(self) -> dict:
         """Generate a mutation analysis report."""
-        report = {
+        report: dict[str, list[dict[str, Any]]] = {
             "tables": [],
             "embedding_warnings": [],
             "index_recommendations": [],
         }
 
+        updated_by_table = _columns_by_table(self.updated_columns)
+        filtered_by_table = _columns_by_table(self.filtered_columns)
+
         for table, pattern in sorted(
             self.patterns.items(),
             key=lambda x: x[1].total_operations,
             reverse=True,
         ):
             # Get top updated columns
-            top_updated = sorted(
-                self.updated_columns.get(table, {}).items(),
-                key=lambda x: x[1],
-                reverse=True,
-            )[:5]
+            top_updated = heapq.nlargest(
+                5, updated_by_table.get(table, []), key=itemgetter(1)
+            )
 
             # Get top filtered columns
-            top_filtered = sorted(
-                self.filtered_columns.get(table, {}).items(),
-                key=lambda x: x[1],
-                reverse=True,
-            )[:5]
+            top_filtered = heapq.nlargest(
+                5, filtered_by_table.get(table, []), key=itemgetter(1)
+            )
 
             table_report = {
                 "table": table,
@@ -296,3 +369,30 @@ class MutationAnalyzer:
     def queries_processed(self) -> int:
         """Number of queries processed."""
         return self._queries_processed
+
+
+# Statement class -> handler; exact type lookup instead of isinstance chain
+_HANDLERS: dict[type[exp.Expression], Callable[..., None]] = {
+    exp.Select: MutationAnalyzer._process_select,
+    exp.Insert: MutationAnalyzer._process_insert,
+    exp.Update: MutationAnalyzer._process_update,
+    exp.Delete: MutationAnalyzer._process_delete,
+}
+
+
+def _columns_by_table(
+    counts: Counter[tuple[str, str]],
+) -> dict[str, list[tuple[str, int]]]:
+    """Group (table, column) counts into per-table (column, count) lists."""
+    by_table: dict[str, list[tuple[str, int]]] = {}
+    for (table, col_name), count in counts.items():
+        by_table.setdefault(table, []).append((col_name, count))
+    return by_table
+
+
+def _analyze_chunk(queries: Sequence[QueryLog]) -> MutationAnalyzer:
+    """Process-pool worker: analyze one chunk of queries."""
+    analyzer = MutationAnalyzer()
+    for query in queries:
+        analyzer._process_query(query)
+    return analyzer
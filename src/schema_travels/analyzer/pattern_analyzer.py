@@ -1,10 +1,15 @@
 """Main pattern analyzer that orchestrates all analysis modules."""
 
-import uuid
+import heapq
 from datetime import datetime
+from operator import attrgetter, itemgetter
 from pathlib import Path
+from secrets import token_hex
+
+from sqlglot import exp
 
 from schema_travels.collector.models import QueryLog, SchemaDefinition
+from schema_travels.analyzer._parse_cache import parse_many, parse_sql
 from schema_travels.analyzer.models import (
     AccessPattern,
     AnalysisResult,
@@ -34,12 +39,28 @@ class PatternAnalyzer:
         self.schema = schema
         self.hot_join_analyzer = HotJoinAnalyzer()
         self.mutation_analyzer = MutationAnalyzer()
-        self._analysis_id = str(uuid.uuid4())[:8]
+        self._analysis_id = token_hex(4)
+        # (result, cardinality key, evaluated recommendations) of the last call
+        self._recommendation_memo: tuple[AnalysisResult, tuple, list[dict]] | None = None
+
+    def reset(self) -> None:
+        """
+        Clear the state of a previous analysis so the instance can be reused.
+
+        The sub-analyzers keep their identity. A new analysis ID is drawn,
+        since the next analysis shares no state with the previous one.
+        """
+        self.hot_join_analyzer.reset()
+        self.mutation_analyzer.reset()
+        self._analysis_id = token_hex(4)
+        self._recommendation_memo = None
 
     def analyze(
         self,
         queries: list[QueryLog],
         source_db_type: str = "postgres",
+        workers: int = 1,
+        threads: int = 1,
     ) -> AnalysisResult:
         """
         Perform complete analysis on query logs.
@@ -47,25 +68,39 @@ class PatternAnalyzer:
         Args:
             queries: List of query logs to analyze
             source_db_type: Source database type (postgres, mysql)
+            workers: Number of processes each analyzer may use
+            threads: Number of parser threads used when parsing the queries
 
         Returns:
             Complete analysis result
         """
+        # A reused instance starts from clean counts
+        self.reset()
+
         # Run individual analyzers
-        join_patterns = self.hot_join_analyzer.analyze(queries)
-        mutation_patterns = self.mutation_analyzer.analyze(queries)
+        if workers > 1:
+            join_patterns = self.hot_join_analyzer.analyze(queries, workers=workers)
+            mutation_patterns = self.mutation_analyzer.analyze(queries, workers=workers)
+        else:
+            # Parse once and share the ASTs between both analyzers
+            parsed_queries = self.parse_all(queries, threads=threads)
+            join_patterns = self.hot_join_analyzer.analyze_parsed(parsed_queries)
+            mutation_patterns = self.mutation_analyzer.analyze_parsed(parsed_queries)
         table_stats = self.hot_join_analyzer.get_table_statistics()
 
         # Compute access patterns
-        access_patterns = self._compute_access_patterns(table_stats)
+        access_patterns = self._compute_access_patterns(
+            self.hot_join_analyzer.get_table_statistics_map()
+        )
 
-        # Get all tables
-        all_tables = set()
+        # Get all tables and count hot joins in one pass
+        all_tables = set(mutation_patterns)
+        hot_joins_count = 0
         for jp in join_patterns:
             all_tables.add(jp.left_table)
             all_tables.add(jp.right_table)
-        for mp in mutation_patterns.values():
-            all_tables.add(mp.table)
+            if jp.cost_score > 0:
+                hot_joins_count += 1
 
         # Count embedding candidates
         embedding_candidates = self._count_embedding_candidates(
@@ -82,29 +117,37 @@ class PatternAnalyzer:
             access_patterns=access_patterns,
             table_statistics=table_stats,
             tables_analyzed=sorted(all_tables),
-            hot_joins_count=len([jp for jp in join_patterns if jp.cost_score > 0]),
+            hot_joins_count=hot_joins_count,
             embedding_candidates_count=embedding_candidates,
         )
 
+    def parse_all(
+        self, queries: list[QueryLog], threads: int = 1
+    ) -> list[tuple[QueryLog, exp.Expression | None]]:
+        """
+        Parse every query once so the results can be shared by the analyzers.
+
+        Args:
+            queries: List of query logs to parse
+            threads: Number of parser threads (1 = parse inline)
+
+        Returns:
+            (query, parsed expression or None) pairs, in input order
+        """
+        sqls = [query.sql for query in queries]
+        parsed = parse_many(sqls, threads) if threads > 1 else [parse_sql(sql) for sql in sqls]
+        return list(zip(queries, parsed, strict=True))
+
     def _compute_access_patterns(
-        self, table_stats: list[TableStatistics]
+        self, stats_lookup: dict[str, TableStatistics]
     ) -> list[AccessPattern]:
-        """Compute co-access patterns from table statistics."""
+        """Compute co-access patterns from table statistics keyed by table."""
         access_patterns = []
         co_access_matrix = self.hot_join_analyzer.get_co_access_matrix()
 
-        # Create lookup for table stats
-        stats_lookup = {ts.table: ts for ts in table_stats}
-
-        # For each pair of tables that appear in joins
-        processed_pairs = set()
-
+        # For each pair of tables that appear in joins. Matrix keys are
+        # already sorted (table_a, table_b) tuples, so each pair occurs once.
         for (table_a, table_b), co_access_count in co_access_matrix.items():
-            pair = tuple(sorted([table_a, table_b]))
-            if pair in processed_pairs:
-                continue
-            processed_pairs.add(pair)
-
             stats_a = stats_lookup.get(table_a)
             stats_b = stats_lookup.get(table_b)
 
@@ -122,7 +165,7 @@ class PatternAnalyzer:
             )
 
         # Sort by co-access ratio
-        access_patterns.sort(key=lambda ap: ap.co_access_ratio, reverse=True)
+        access_patterns.sort(key=attrgetter("co_access_ratio"), reverse=True)
 
         return access_patterns
 
@@ -132,29 +175,35 @@ class PatternAnalyzer:
         mutation_patterns: dict[str, MutationPattern],
         access_patterns: list[AccessPattern],
     ) -> int:
-        """Count table pairs that are good embedding candidates."""
+        """
+        Count table pairs that are good embedding candidates.
+
+        Expects access_patterns sorted by co-access ratio (descending), as
+        returned by _compute_access_patterns.
+        """
         candidates = 0
+        get_mutations = mutation_patterns.get
 
         for ap in access_patterns:
-            # High co-access ratio
+            ind_a = ap.table_a_independence
+            ind_b = ap.table_b_independence
+
+            # High co-access ratio; the rest of the list is lower still
             if ap.co_access_ratio < 0.7:
-                continue
+                break
+
+            # Check if either table is independently accessed too often
+            if ind_a > 0.4 and ind_b > 0.4:
+                continue  # Both tables accessed independently often
 
             # Check write ratio of potential child table
             # (lower independence = likely child)
-            if ap.table_a_independence < ap.table_b_independence:
-                child_table = ap.table_a
-            else:
-                child_table = ap.table_b
+            child_table = ap.table_a if ind_a < ind_b else ap.table_b
 
-            child_mutations = mutation_patterns.get(child_table)
+            child_mutations = get_mutations(child_table)
             if child_mutations and child_mutations.write_ratio > 0.5:
                 continue  # Too write-heavy to embed
 
-            # Check if either table is independently accessed too often
-            if ap.table_a_independence > 0.4 and ap.table_b_independence > 0.4:
-                continue  # Both tables accessed independently often
-
             candidates += 1
 
         return candidates
@@ -163,6 +212,7 @@ class PatternAnalyzer:
         self,
         result: AnalysisResult,
         cardinality_info: dict[tuple[str, str], dict] | None = None,
+        top_k: int | None = None,
     ) -> list[dict]:
         """
         Generate embedding recommendations based on analysis.
@@ -171,22 +221,33 @@ class PatternAnalyzer:
             result: Analysis result
             cardinality_info: Optional cardinality information for relationships
                               Format: {(parent, child): {"avg": N, "max": M}}
+            top_k: Only return the K most confident recommendations
+                   (None = all of them)
 
         Returns:
-            List of embedding recommendations
+            List of embedding recommendations, most confident first. Repeated
+            calls for the same result share the recommendation dicts, so
+            treat them as read-only.
         """
-        recommendations = []
-        mutation_lookup = {mp.table: mp for mp in result.mutation_patterns}
+        key = (result.analysis_id, _cardinality_key(cardinality_info))
+        memo = self._recommendation_memo
+        if memo is not None and memo[0] is result and memo[1] == key:
+            recommendations = memo[2]
+        else:
+            recommendations = []
+            mutation_lookup = {mp.table: mp for mp in result.mutation_patterns}
 
-        for ap in result.access_patterns:
-            rec = self._evaluate_pair(ap, mutation_lookup, cardinality_info)
-            if rec:
-                recommendations.append(rec)
+            for ap in result.access_patterns:
+                rec = self._evaluate_pair(ap, mutation_lookup, cardinality_info)
+                if rec:
+                    recommendations.append(rec)
 
-        # Sort by confidence
-        recommendations.sort(key=lambda r: r["confidence"], reverse=True)
+            self._recommendation_memo = (result, key, recommendations)
 
-        return recommendations
+        # Sort by confidence
+        if top_k is not None:
+            return heapq.nlargest(top_k, recommendations, key=itemgetter("confidence"))
+        return sorted(recommendations, key=itemgetter("confidence"), reverse=True)
 
     def _evaluate_pair(
         self,
@@ -296,11 +357,11 @@ class PatternAnalyzer:
             "-" * 40,
         ]
 
-        for jp in result.join_patterns[:10]:
-            lines.append(
-                f"  {jp.left_table} ⟷ {jp.right_table}: "
-                f"{jp.frequency:,} calls, {jp.avg_time_ms:.1f}ms avg"
-            )
+        lines.extend(
+            f"  {jp.left_table} ⟷ {jp.right_table}: "
+            f"{jp.frequency:,} calls, {jp.avg_time_ms:.1f}ms avg"
+            for jp in result.join_patterns[:10]
+        )
 
         lines.extend([
             "",
@@ -309,17 +370,11 @@ class PatternAnalyzer:
             "-" * 40,
         ])
 
-        sorted_mutations = sorted(
-            result.mutation_patterns,
-            key=lambda m: m.total_operations,
-            reverse=True,
-        )[:10]
-
-        for mp in sorted_mutations:
-            lines.append(
-                f"  {mp.table}: R={mp.select_count:,} W={mp.total_writes:,} "
-                f"({mp.write_ratio:.0%} writes)"
-            )
+        lines.extend(
+            f"  {mp.table}: R={mp.select_count:,} W={mp.total_writes:,} "
+            f"({mp.write_ratio:.0%} writes)"
+            for mp in result.top_mutations(10)
+        )
 
         lines.extend([
             "",
@@ -332,3 +387,12 @@ class PatternAnalyzer:
         ])
 
         return "\n".join(lines)
+
+
+def _cardinality_key(cardinality_info: dict[tuple[str, str], dict] | None) -> tuple:
+    """Hashable summary of cardinality info for memoizing recommendations."""
+    if not cardinality_info:
+        return ()
+    return tuple(sorted(
+        (pair, tuple(sorted(info.items()))) for pair, info in cardinality_info.items()
+    ))
@@ -0,0 +1,16 @@
+"""Console shared by the CLI commands."""
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+@lru_cache
+def get_console() -> "Console":
+    """Get the shared console, importing rich on first use."""
+    from rich.console import Console
+
+    return Console()
+
@@ -0,0 +1,85 @@
+"""Normalization of recommendations to SchemaRecommendation and RecView.
+
+Kept out of the command modules so the recommender models are only
+imported by commands that display recommendations.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+from schema_travels.recommender.models import RelationshipDecision, SchemaRecommendation
+
+# Lowercase decision value -> member, for lookups without ValueError handling
+_DECISIONS = RelationshipDecision._value2member_map_
+
+
+def _normalize_decision(decision: Any) -> Any:
+    """Map a decision string to the enum (unknown strings become REFERENCE)."""
+    if isinstance(decision, str):
+        return _DECISIONS.get(decision.lower(), RelationshipDecision.REFERENCE)
+    return decision
+
+
+def _from_dict(r: dict[str, Any]) -> SchemaRecommendation:
+    """Build a recommendation from a dict (stored or rule-based)."""
+    return SchemaRecommendation(
+        parent_table=r.get("parent_table") or "",
+        child_table=r.get("child_table") or "",
+        decision=_normalize_decision(r.get("decision", "reference")),
+        confidence=r.get("confidence") or 0.5,
+        reasoning=r.get("reasoning") or [],
+        warnings=r.get("warnings") or [],
+    )
+
+
+def _from_obj(r: Any) -> SchemaRecommendation:
+    """Build a recommendation from an object with recommendation attributes."""
+    return SchemaRecommendation(
+        parent_table=r.parent_table or "",
+        child_table=r.child_table or "",
+        decision=_normalize_decision(r.decision),
+        confidence=getattr(r, "confidence", 0.5),
+        reasoning=getattr(r, "reasoning", []),
+        warnings=getattr(r, "warnings", []),
+    )
+
+
+def to_schema_rec(r: Any) -> SchemaRecommendation:
+    """Convert various recommendation formats to SchemaRecommendation."""
+    if isinstance(r, SchemaRecommendation):
+        return r
+    if isinstance(r, dict):
+        return _from_dict(r)
+    return _from_obj(r)
+
+
+@dataclass(slots=True)
+class RecView:
+    """A recommendation as the CLI shows it, next to the form that is saved."""
+
+    rec: SchemaRecommendation
+    # Decision as given, upper-cased; rule-based labels outside
+    # RelationshipDecision (such as EVALUATE) are kept
+    label: str
+    # Confidence as given (0 when missing), used by --min-confidence
+    confidence: float
+
+
+def to_view(r: Any) -> RecView:
+    """Convert a recommendation of any supported format to a RecView."""
+    rec = to_schema_rec(r)
+    if rec is r:
+        return RecView(rec, rec.decision.value.upper(), rec.confidence)
+    if isinstance(r, dict):
+        decision = r.get("decision", "")
+        confidence = r.get("confidence") or 0
+    else:
+        decision = r.decision
+        confidence = getattr(r, "confidence", 0)
+    label = decision.value if isinstance(decision, RelationshipDecision) else str(decision)
+    return RecView(rec, label.upper(), confidence)
+
+
+def normalize_recs(recommendations) -> list[RecView]:
+    """Convert recommendations (objects or stored dicts) to RecViews."""
+    return [to_view(r) for r in recommendations]
@@ -0,0 +1,513 @@
+"""The analyze command."""
+
+import json
+import logging
+import sys
+from pathlib import Path
+from secrets import token_hex
+from typing import Any
+
+import click
+
+from schema_travels.cli._common import get_console
+
+logger = logging.getLogger(__name__)
+
+# Heading color per rewrite decision (anything else is magenta)
+_REWRITE_COLORS = {"EMBED": "green", "REFERENCE": "blue", "SEPARATE": "yellow"}
+
+
+@click.command()
+@click.option(
+    "--logs-dir",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    required=True,
+    help="Directory containing database query logs",
+)
+@click.option(
+    "--schema-file",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    required=True,
+    help="SQL schema file (DDL)",
+)
+@click.option(
+    "--db-type",
+    type=click.Choice(["postgres", "mysql"]),
+    default="postgres",
+    help="Source database type",
+)
+@click.option(
+    "--target",
+    type=click.Choice(["mongodb", "dynamodb"]),
+    default="mongodb",
+    help="Target database type",
+)
+@click.option(
+    "--output",
+    type=click.Path(path_type=Path),
+    help="Output file for results (JSON)",
+)
+@click.option(
+    "--use-ai/--no-ai",
+    default=True,
+    help="Use Claude AI for recommendations",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Bypass recommendation cache and get fresh AI analysis",
+)
+@click.option(
+    "--clear-cache",
+    is_flag=True,
+    default=False,
+    help="Clear all cached recommendations before running",
+)
+@click.option(
+    "--cache-mode",
+    type=click.Choice(["relaxed", "strict"]),
+    default="relaxed",
+    help="Cache mode: 'relaxed' ignores small log changes, 'strict' invalidates on any change",
+)
+@click.option(
+    "--min-confidence",
+    type=float,
+    default=None,
+    help="Only show recommendations at or above this confidence threshold (0.0-1.0)",
+)
+@click.option(
+    "--show-rewrites",
+    is_flag=True,
+    default=False,
+    help="Display SQL → MongoDB query rewrite examples for each recommendation",
+)
+@click.option(
+    "--compact-json",
+    is_flag=True,
+    default=False,
+    help="Write --output JSON without indentation (smaller and faster to write)",
+)
+@click.option(
+    "--display-top",
+    type=click.IntRange(min=1),
+    default=10,
+    help="Number of rows shown per summary table (JSON output is always complete)",
+)
+def analyze(
+    logs_dir: Path,
+    schema_file: Path,
+    db_type: str,
+    target: str,
+    output: Path | None,
+    use_ai: bool,
+    no_cache: bool,
+    clear_cache: bool,
+    cache_mode: str,
+    min_confidence: float | None,
+    show_rewrites: bool,
+    compact_json: bool,
+    display_top: int,
+) -> None:
+    """Analyze database access patterns and generate recommendations.
+
+    Parses query logs and schema to identify hot joins, mutation patterns,
+    and co-access patterns. Generates recommendations for NoSQL schema design.
+    
+    Cache modes:
+    
+    \b
+    - relaxed (default): Ignores small log changes. Cache invalidates only when
+      schema changes or access patterns significantly change (new joins, tables
+      flip from read-heavy to write-heavy).
+    
+    \b
+    - strict: Any change in query counts invalidates cache. Use when you want
+      fresh recommendations for every data change.
+    
+    Use --no-cache to bypass cache entirely for one run.
+    Use --clear-cache to invalidate all cached recommendations.
+    """
+    # Heavy analysis stack is imported here so other commands start fast
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    from schema_travels.config import get_settings, APIKeyNotConfiguredError
+    from schema_travels.collector import PostgresLogParser, MySQLLogParser, SchemaParser
+    from schema_travels.analyzer import PatternAnalyzer
+    from schema_travels.recommender import ClaudeAdvisor, SchemaGenerator
+    from schema_travels.recommender.models import TargetDatabase
+    from schema_travels.recommender.cache import compute_input_hash, get_cache, CacheMode
+    from schema_travels.persistence import get_repository
+    from schema_travels.cli._recs import normalize_recs
+
+    console = get_console()
+
+    analysis_id = token_hex(4)
+    target_db = TargetDatabase(target)
+    
+    # Handle cache clearing
+    cache = get_cache()
+    if clear_cache:
+        count = cache.invalidate_all()
+        console.print(f"[yellow]Cleared {count} cached recommendations[/yellow]")
+
+    console.print(Panel.fit(
+        f"[bold blue]Schema Travels Analysis[/bold blue]\n"
+        f"Analysis ID: {analysis_id}",
+        title="Starting Analysis",
+    ))
+
+    # Initialize repository. The analysis record is written together with
+    # its results, so a successful run costs a single commit.
+    repo = get_repository()
+    analysis_record = {
+        "analysis_id": analysis_id,
+        "source_db_type": db_type,
+        "target_db_type": target,
+        "logs_dir": str(logs_dir),
+        "schema_file": str(schema_file),
+    }
+    saved = False
+
+    try:
+        # One spinner task relabelled per phase; no live rendering (and no
+        # refresh thread) when stdout is not a terminal
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+            disable=not console.is_terminal,
+        ) as progress:
+            # Parse schema
+            task = progress.add_task("Parsing schema...", total=None)
+            schema_parser = SchemaParser(dialect=db_type)
+            schema = schema_parser.parse_file(schema_file)
+            console.print(f"  Found {len(schema.tables)} tables, {len(schema.foreign_keys)} relationships")
+
+            # Parse logs
+            progress.update(task, description="Parsing query logs...")
+            if db_type == "postgres":
+                log_parser = PostgresLogParser(logs_dir)
+            else:
+                log_parser = MySQLLogParser(logs_dir)
+
+            queries = log_parser.parse()
+            console.print(f"  Parsed {len(queries)} queries")
+
+            # Analyze patterns
+            progress.update(task, description="Analyzing access patterns...")
+            analyzer = PatternAnalyzer(schema)
+            result = analyzer.analyze(queries, source_db_type=db_type)
+            result.analysis_id = analysis_id
+
+            # Get recommendations
+            recommendations = []
+            cache_used = False
+            valid_recs = []  # Initialize here for use later
+            rec_views = []
+            
+            if use_ai:
+                settings = get_settings()
+                
+                # Check if API key is configured
+                if not settings.has_api_key():
+                    console.print("[yellow]⚠ API key not configured, using rule-based recommendations[/yellow]")
+                    console.print("[dim]  Set ANTHROPIC_API_KEY or use --no-ai flag[/dim]")
+                    recommendations = analyzer.get_embedding_recommendations(result)
+                else:
+                    # Check cache first (unless --no-cache, which bypasses
+                    # the cache entirely, so no input hash is needed)
+                    input_hash = None
+                    if not no_cache:
+                        progress.update(task, description="Checking recommendation cache...")
+                        mode = CacheMode(cache_mode)
+                        input_hash = compute_input_hash(schema, result, target_db, mode)
+                        cached_recs = cache.get(input_hash)
+                        
+                        if cached_recs:
+                            recommendations = cached_recs
+                            cache_used = True
+                            console.print(f"  [green]✓ Using cached recommendations[/green] [dim](hash: {input_hash}, mode: {cache_mode})[/dim]")
+                    
+                    # If not cached, call Claude API
+                    if not recommendations:
+                        try:
+                            progress.update(task, description="Getting AI recommendations...")
+                            advisor = ClaudeAdvisor()
+                            recommendations = advisor.get_recommendations(
+                                schema, result, target_db
+                            )
+                            
+                            # Cache the recommendations
+                            if input_hash is not None:
+                                cache.put(input_hash, recommendations, metadata={
+                                    "analysis_id": analysis_id,
+                                    "logs_dir": str(logs_dir),
+                                    "schema_file": str(schema_file),
+                                    "cache_mode": cache_mode,
+                                })
+                                console.print(f"  [dim]Cached recommendations (hash: {input_hash}, mode: {cache_mode})[/dim]")
+                            
+                        except APIKeyNotConfiguredError as e:
+                            console.print(e.message)
+                            sys.exit(1)
+            else:
+                recommendations = analyzer.get_embedding_recommendations(result)
+
+            # Validate recommendations
+            if recommendations:
+                # Convert and drop invalid recommendations (must have both
+                # parent and child tables) in one pass
+                rec_views = normalize_recs(recommendations)
+                valid_recs = [
+                    v.rec for v in rec_views
+                    if v.rec.parent_table and v.rec.child_table
+                ]
+                
+                if valid_recs:
+                    dropped = len(recommendations) - len(valid_recs)
+                    if dropped:
+                        console.print(f"  [yellow]Filtered {dropped} invalid recommendations[/yellow]")
+                else:
+                    console.print("  [yellow]No valid recommendations to save[/yellow]")
+
+            # Generate target schema
+            progress.update(task, description="Generating target schema...")
+            generator = SchemaGenerator(schema, result, valid_recs)
+            target_schema = generator.generate(target_db)
+
+            # Save the analysis, recommendations and target schema with one commit
+            with repo.transaction():
+                repo.create_analysis(**analysis_record)
+                repo.save_analysis_result(result)
+                if valid_recs:
+                    repo.save_recommendations(analysis_id, valid_recs)
+                repo.save_target_schema(analysis_id, target_schema)
+            saved = True
+
+        # Display results
+        _display_analysis_summary(
+            result, recommendations, target_schema, 
+            cache_used=cache_used,
+            min_confidence=min_confidence,
+            show_rewrites=show_rewrites,
+            display_top=display_top,
+            rec_views=rec_views,
+        )
+
+        # Save to file if requested. Model objects are converted by the
+        # encoder as it reaches them, so their dict trees are never all
+        # alive at once.
+        if output:
+            output_data = {
+                "analysis_id": analysis_id,
+                "cache_used": cache_used,
+                "cache_mode": cache_mode,
+                "analysis": result,
+                "recommendations": recommendations,
+                "target_schema": target_schema,
+            }
+            _write_json(output, output_data, compact=compact_json)
+            console.print(f"\n[green]Results saved to {output}[/green]")
+
+        console.print(f"\n[bold green]✓ Analysis complete![/bold green]")
+        console.print(f"  Analysis ID: {analysis_id}")
+        if cache_used:
+            console.print(f"  [dim]Used cached recommendations. Run with --no-cache for fresh analysis.[/dim]")
+        console.print(f"  View report: schema-travels report --analysis-id {analysis_id}")
+
+    except Exception as e:
+        # Runs after any rollback, so the failed record is kept
+        with repo.transaction():
+            if not saved:
+                repo.create_analysis(**analysis_record)
+            repo.update_analysis_status(analysis_id, "failed")
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        logger.exception("Analysis failed")
+        sys.exit(1)
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize model objects through their to_dict()."""
+    to_dict = getattr(obj, "to_dict", None)
+    if to_dict is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return to_dict()
+
+
+def _write_json(path: Path, data, compact: bool = False) -> None:
+    """
+    Write data as UTF-8 JSON, using orjson when it is installed.
+
+    Objects with a to_dict() method (including dataclasses) are serialized
+    through it in the same pass, so callers need not convert them first.
+
+    Args:
+        path: Output file
+        data: Data to serialize
+        compact: Write without indentation or spaces after separators
+    """
+    try:
+        import orjson
+    except ImportError:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(
+                data,
+                f,
+                indent=None if compact else 2,
+                separators=(",", ":") if compact else None,
+                ensure_ascii=False,
+                default=_json_default,
+            )
+        return
+
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS
+    if not compact:
+        option |= orjson.OPT_INDENT_2
+    path.write_bytes(orjson.dumps(data, default=_json_default, option=option))
+
+
+def _confidence_color(confidence: float) -> str:
+    """Return Rich color markup based on confidence level."""
+    if confidence >= 0.85:
+        return "green"
+    elif confidence >= 0.70:
+        return "yellow"
+    else:
+        return "red"
+
+
+def _display_analysis_summary(
+    result, 
+    recommendations, 
+    target_schema, 
+    cache_used: bool = False,
+    min_confidence: float | None = None,
+    show_rewrites: bool = False,
+    display_top: int = 10,
+    rec_views: list | None = None,
+) -> None:
+    """Display analysis summary in console, showing up to display_top rows per table.
+
+    rec_views are the recommendations already normalized by
+    normalize_recs (as analyze does before saving); when omitted they are
+    built here.
+    """
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.table import Table
+
+    from schema_travels.cli._recs import normalize_recs
+
+    # Collect every renderable and print them in one pass at the end
+    parts: list[Any] = ["\n"]
+    add = parts.append
+
+    # Hot joins table
+    if result.join_patterns:
+        table = Table(title=f"🔥 Hot Joins (Top {display_top})")
+        table.add_column("Tables", style="cyan")
+        table.add_column("Frequency", justify="right")
+        table.add_column("Avg Time", justify="right")
+        table.add_column("Cost Score", justify="right", style="yellow")
+
+        add_row = table.add_row
+        # join_patterns is already sorted by cost score
+        for jp in result.join_patterns[:display_top]:
+            add_row(
+                f"{jp.left_table} ⟷ {jp.right_table}",
+                f"{jp.frequency:,}",
+                f"{jp.avg_time_ms:.1f}ms",
+                f"{jp.cost_score:,.0f}",
+            )
+
+        add(table)
+
+    # Mutation patterns
+    if result.mutation_patterns:
+        add("\n")
+        table = Table(title="📊 Mutation Patterns")
+        table.add_column("Table", style="cyan")
+        table.add_column("Reads", justify="right")
+        table.add_column("Writes", justify="right")
+        table.add_column("Write %", justify="right")
+        table.add_column("Type", style="yellow")
+
+        add_row = table.add_row
+        for mp in result.top_mutations(display_top):
+            type_label = "📖 Read-heavy" if mp.is_read_heavy else ("✏️ Write-heavy" if mp.is_write_heavy else "⚖️ Mixed")
+            add_row(
+                mp.table,
+                f"{mp.select_count:,}",
+                f"{mp.total_writes:,}",
+                f"{mp.write_ratio:.0%}",
+                type_label,
+            )
+
+        add(table)
+
+    # Recommendations
+    if recommendations:
+        # Convert to consistent format and filter by confidence
+        if rec_views is None:
+            rec_views = normalize_recs(recommendations)
+        if min_confidence is not None:
+            rec_views = [v for v in rec_views if v.confidence >= min_confidence]
+        
+        add("\n")
+        title = "💡 Schema Recommendations"
+        if cache_used:
+            title += " [dim](cached)[/dim]"
+        if min_confidence is not None:
+            title += f" [dim](≥{min_confidence:.0%} confidence)[/dim]"
+        table = Table(title=title)
+        table.add_column("Relationship", style="cyan")
+        table.add_column("Decision", style="green")
+        table.add_column("Confidence", justify="right")
+        table.add_column("Reasoning")
+
+        add_row = table.add_row
+        for view in rec_views[:display_top]:
+            r = view.rec
+            color = _confidence_color(view.confidence)
+            add_row(
+                f"{r.parent_table} → {r.child_table}",
+                view.label,
+                f"[{color}]{view.confidence:.0%}[/{color}]",
+                r.reasoning[0] if r.reasoning else "",
+            )
+
+        add(table)
+        
+        if min_confidence is not None and len(rec_views) < len(recommendations):
+            add(f"  [dim]({len(recommendations) - len(rec_views)} recommendations below {min_confidence:.0%} confidence hidden)[/dim]")
+        
+        # Show query rewrites if requested
+        if show_rewrites and rec_views:
+            add("\n")
+            add(Panel.fit(
+                "[bold]📝 SQL → MongoDB Query Rewrites[/bold]",
+                title="Query Examples",
+            ))
+            
+            from schema_travels.recommender import generate_rewrites
+
+            rewrite_result = generate_rewrites([v.rec for v in rec_views])
+            
+            for example in rewrite_result.examples:
+                color = _REWRITE_COLORS.get(example.decision, "magenta")
+                add(f"\n[bold {color}]━━━ {example.relationship} ({example.decision}) ━━━[/bold {color}]")
+                add(f"[dim]Scenario:[/dim] {example.scenario}\n")
+                add("[bold]SQL:[/bold]")
+                add(Panel(example.sql, border_style="dim"))
+                add("[bold]MongoDB:[/bold]")
+                add(Panel(example.mongodb, border_style="dim"))
+                add(f"[dim]Why:[/dim] {example.explanation}")
+            
+            if rewrite_result.errors:
+                add("\n[yellow]Rewrite warnings:[/yellow]")
+                for err in rewrite_result.errors:
+                    add(f"  [dim]• {err}[/dim]")
+
+    get_console().print(Group(*parts))
@@ -0,0 +1,22 @@
+"""The clear-cache command."""
+
+import click
+
+from schema_travels.cli._common import get_console
+
+
+@click.command("clear-cache")
+@click.confirmation_option(prompt="Are you sure you want to clear all cached recommendations?")
+def clear_cache_cmd() -> None:
+    """Clear all cached recommendations.
+
+    Remove all cached AI recommendations. Next analysis will
+    fetch fresh recommendations from Claude.
+    """
+    from schema_travels.recommender.cache import get_cache
+
+    console = get_console()
+
+    cache = get_cache()
+    count = cache.invalidate_all()
+    console.print(f"[green]Cleared {count} cached recommendations[/green]")
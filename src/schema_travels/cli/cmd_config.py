@@ -0,0 +1,45 @@
+"""The config command."""
+
+import click
+
+from schema_travels.cli._common import get_console
+
+
+@click.command()
+def config() -> None:
+    """Show current configuration.
+
+    Display the current configuration settings including
+    API key status and default values.
+    """
+    from rich.panel import Panel
+    from rich.table import Table
+
+    from schema_travels.config import get_settings
+    from schema_travels.recommender.cache import get_cache
+
+    console = get_console()
+
+    settings = get_settings()
+
+    console.print(Panel.fit(
+        "[bold]Schema Travels Configuration[/bold]",
+        title="Config",
+    ))
+
+    table = Table(show_header=True)
+    table.add_column("Setting", style="cyan")
+    table.add_column("Value", style="green")
+
+    table.add_row("API Key", "✓ Configured" if settings.has_api_key() else "✗ Not set")
+    table.add_row("Model", settings.anthropic_model)
+    table.add_row("Database", str(settings.db_path))
+    table.add_row("Cache Dir", str(settings.db_path.parent / "cache"))
+    table.add_row("Default Target", settings.default_target)
+    table.add_row("Default DB Type", settings.default_db_type)
+    table.add_row("Log Level", settings.log_level)
+
+    console.print(table)
+    
+    # Show cache stats
+    console.print(f"\n[dim]Cached recommendations: {get_cache().count()}[/dim]")
@@ -0,0 +1,32 @@
+"""The delete command."""
+
+import sys
+
+import click
+
+from schema_travels.cli._common import get_console
+
+
+@click.command()
+@click.option(
+    "--analysis-id",
+    required=True,
+    help="Analysis ID to delete",
+)
+@click.confirmation_option(prompt="Are you sure you want to delete this analysis?")
+def delete(analysis_id: str) -> None:
+    """Delete an analysis.
+
+    Remove an analysis and all associated data from the database.
+    """
+    from schema_travels.persistence import get_repository
+
+    console = get_console()
+
+    repo = get_repository()
+
+    if repo.delete_analysis(analysis_id):
+        console.print(f"[green]Deleted analysis: {analysis_id}[/green]")
+    else:
+        console.print(f"[red]Analysis not found: {analysis_id}[/red]")
+        sys.exit(1)
@@ -0,0 +1,53 @@
+"""The history command."""
+
+import click
+
+from schema_travels.cli._common import get_console
+
+
+@click.command()
+@click.option(
+    "--limit",
+    default=20,
+    help="Maximum number of analyses to show",
+)
+def history(limit: int) -> None:
+    """List past analyses.
+
+    Show a list of all previous analyses with their status and key metrics.
+    """
+    from rich.table import Table
+
+    from schema_travels.persistence import get_repository
+
+    console = get_console()
+
+    repo = get_repository()
+    analyses = repo.list_analyses(limit=limit)
+
+    if not analyses:
+        console.print("[yellow]No analyses found.[/yellow]")
+        console.print("Run 'schema-travels analyze' to create one.")
+        return
+
+    table = Table(title="Analysis History")
+    table.add_column("ID", style="cyan")
+    table.add_column("Created", style="green")
+    table.add_column("Source", style="blue")
+    table.add_column("Target", style="blue")
+    table.add_column("Queries", justify="right")
+    table.add_column("Tables", justify="right")
+    table.add_column("Status", style="yellow")
+
+    for a in analyses:
+        table.add_row(
+            a["id"],
+            str(a["created_at"])[:19],
+            a["source_db_type"],
+            a["target_db_type"],
+            str(a["total_queries"]),
+            str(a["tables_analyzed"]),
+            a["status"],
+        )
+
+    console.print(table)
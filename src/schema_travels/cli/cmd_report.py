@@ -0,0 +1,110 @@
+"""The report command."""
+
+import sys
+
+import click
+
+from schema_travels.cli._common import get_console
+
+
+@click.command()
+@click.option(
+    "--analysis-id",
+    required=True,
+    help="Analysis ID to generate report for",
+)
+@click.option(
+    "--format",
+    type=click.Choice(["text", "json", "markdown"]),
+    default="text",
+    help="Output format",
+)
+def report(analysis_id: str, format: str) -> None:
+    """View analysis report.
+
+    Display detailed report for a previous analysis including
+    hot joins, mutation patterns, and recommendations.
+    """
+    from schema_travels.persistence import get_repository
+
+    console = get_console()
+
+    repo = get_repository()
+
+    analysis = repo.get_analysis(analysis_id)
+    if not analysis:
+        console.print(f"[red]Analysis not found: {analysis_id}[/red]")
+        sys.exit(1)
+
+    result = repo.get_analysis_result(analysis_id)
+    recommendations = repo.get_recommendations(analysis_id)
+    target_schema = repo.get_target_schema(analysis_id)
+
+    if format == "json":
+        output = {
+            "analysis": analysis,
+            "result": result,
+            "recommendations": recommendations,
+            "target_schema": target_schema,
+        }
+        console.print_json(data=output)
+    elif format == "markdown":
+        _print_markdown_report(analysis, result, recommendations, target_schema)
+    else:
+        _print_text_report(analysis, result, recommendations, target_schema)
+
+
+def _print_text_report(analysis, result, recommendations, target_schema) -> None:
+    """Print text format report."""
+    from rich.panel import Panel
+
+    from schema_travels.cli._recs import to_schema_rec
+
+    console = get_console()
+
+    console.print(Panel.fit(
+        f"[bold]Analysis Report[/bold]\n"
+        f"ID: {analysis['id']}\n"
+        f"Created: {analysis['created_at']}\n"
+        f"Status: {analysis['status']}",
+        title="Analysis",
+    ))
+
+    if result:
+        console.print(f"\nQueries analyzed: {len(result.get('join_patterns', []))} join patterns found")
+
+    if recommendations:
+        console.print(f"\n[bold]Recommendations ({len(recommendations)}):[/bold]")
+        for r in map(to_schema_rec, recommendations):
+            console.print(f"  • {r.parent_table} → {r.child_table}: {r.decision.value}")
+
+
+def _print_markdown_report(analysis, result, recommendations, target_schema) -> None:
+    """Print markdown format report."""
+    from schema_travels.cli._recs import to_schema_rec
+
+    console = get_console()
+
+    lines = [
+        f"# Analysis Report: {analysis['id']}",
+        "",
+        f"**Created:** {analysis['created_at']}",
+        f"**Source:** {analysis['source_db_type']}",
+        f"**Target:** {analysis['target_db_type']}",
+        f"**Status:** {analysis['status']}",
+        "",
+    ]
+
+    if recommendations:
+        lines.extend([
+            "## Recommendations",
+            "",
+            "| Relationship | Decision | Confidence |",
+            "|-------------|----------|------------|",
+        ])
+        lines.extend(
+            f"| {r.parent_table} → {r.child_table} | {r.decision.value} | {r.confidence:.0%} |"
+            for r in map(to_schema_rec, recommendations)
+        )
+
+    console.print("\n".join(lines))
@@ -0,0 +1,56 @@
+"""The simulate command."""
+
+import json
+import sys
+from pathlib import Path
+
+import click
+
+from schema_travels.cli._common import get_console
+
+
+@click.command()
+@click.option(
+    "--analysis-id",
+    required=True,
+    help="Analysis ID to simulate",
+)
+@click.option(
+    "--row-counts",
+    type=click.Path(exists=True, path_type=Path),
+    help="JSON file with table row counts",
+)
+def simulate(analysis_id: str, row_counts: Path | None) -> None:
+    """Run migration simulation.
+
+    Estimate storage, latency, and cost impact of the migration
+    based on analysis results.
+    """
+    from schema_travels.persistence import get_repository
+
+    console = get_console()
+
+    repo = get_repository()
+
+    analysis = repo.get_analysis(analysis_id)
+    if not analysis:
+        console.print(f"[red]Analysis not found: {analysis_id}[/red]")
+        sys.exit(1)
+
+    # Load data
+    result_data = repo.get_analysis_result(analysis_id)
+    target_schema_data = repo.get_target_schema(analysis_id)
+
+    if not result_data or not target_schema_data:
+        console.print("[red]Analysis result or target schema not found[/red]")
+        sys.exit(1)
+
+    # Load row counts if provided
+    table_row_counts = None
+    if row_counts:
+        with open(row_counts) as f:
+            table_row_counts = json.load(f)
+
+    # Reconstruct objects (simplified - would need proper deserialization)
+    console.print("[yellow]Simulation functionality requires schema reconstruction...[/yellow]")
+    console.print("For full simulation, please re-run analysis with --simulate flag.")
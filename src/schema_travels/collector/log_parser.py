@@ -1,13 +1,47 @@
 """Log parser module for extracting queries from database log files."""
 
 import re
+import sys
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from fnmatch import fnmatch
+from itertools import repeat
 from pathlib import Path
 from typing import Iterator
 
 from schema_travels.collector.models import QueryLog
 
+# Read buffer for log files; large reads keep the number of read syscalls
+# per file low without loading the whole file into memory
+READ_BUFFER_SIZE = 1 << 20
+
+
+@dataclass(slots=True)
+class _PgEntry:
+    """Prefix fields of the PostgreSQL log line that starts an entry."""
+
+    timestamp: str
+    timezone: str | None
+    pid: str
+    user: str | None
+    database: str | None
+    level: str
+    message: str
+
+
+@dataclass(slots=True)
+class _MySQLEntry:
+    """Header fields collected for one MySQL slow log entry."""
+
+    timestamp: str | None = None
+    user: str | None = None
+    host: str | None = None
+    query_time: str | None = None
+    rows_sent: str | None = None
+    rows_examined: str | None = None
+
 
 class LogParser(ABC):
     """Abstract base class for database log parsers."""
@@ -18,10 +52,39 @@ class LogParser(ABC):
         if not self.logs_dir.exists():
             raise FileNotFoundError(f"Logs directory not found: {self.logs_dir}")
 
-    @abstractmethod
-    def parse(self) -> list[QueryLog]:
-        """Parse all log files and return query logs."""
-        pass
+    def parse(self, workers: int = 1) -> list[QueryLog]:
+        """
+        Parse all log files and return query logs.
+
+        Args:
+            workers: Number of processes to parse files in; each file is
+                     parsed by a single process (1 = parse in this process)
+
+        Returns:
+            Query logs in file order
+        """
+        return list(self.iter_parse(workers))
+
+    def iter_parse(self, workers: int = 1) -> Iterator[QueryLog]:
+        """
+        Stream query logs from all log files without building a list.
+
+        Args:
+            workers: Number of processes to parse files in (see parse());
+                     with workers, one file's queries are held at a time
+
+        Yields:
+            Query logs in file order
+        """
+        files = self.get_log_files()
+        if workers > 1 and len(files) > 1:
+            with ProcessPoolExecutor(max_workers=min(workers, len(files))) as executor:
+                for file_queries in executor.map(_parse_file, repeat(self), files):
+                    yield from file_queries
+            return
+
+        for log_file in files:
+            yield from self.parse_file(log_file)
 
     @abstractmethod
     def parse_file(self, file_path: Path) -> Iterator[QueryLog]:
@@ -29,12 +92,16 @@ class LogParser(ABC):
         pass
 
     def get_log_files(self) -> list[Path]:
-        """Get all log files in the directory."""
+        """Get all log files in the directory, each listed once."""
+        # One directory scan; a file matching several patterns is still
+        # parsed only once. Dotfiles are skipped, as glob() does.
         patterns = self._get_file_patterns()
-        files = []
-        for pattern in patterns:
-            files.extend(self.logs_dir.glob(pattern))
-        return sorted(files)
+        return sorted(
+            path for path in self.logs_dir.iterdir()
+            if not path.name.startswith(".")
+            and any(fnmatch(path.name, pattern) for pattern in patterns)
+            and path.is_file()
+        )
 
     @abstractmethod
     def _get_file_patterns(self) -> list[str]:
@@ -56,6 +123,13 @@ class PostgresLogParser(LogParser):
         r"(?P<message>.*)"
     )
 
+    # Severity labels the prefix scanner accepts without consulting the regex
+    LOG_LEVELS = frozenset({
+        "DEBUG1", "DEBUG2", "DEBUG3", "DEBUG4", "DEBUG5", "INFO", "NOTICE",
+        "WARNING", "ERROR", "LOG", "FATAL", "PANIC",
+        "DETAIL", "HINT", "QUERY", "CONTEXT", "STATEMENT", "LOCATION",
+    })
+
     # Duration pattern: duration: 123.456 ms
     DURATION_PATTERN = re.compile(r"duration:\s+(?P<duration>[\d.]+)\s+ms")
 
@@ -66,48 +140,121 @@ class PostgresLogParser(LogParser):
         """PostgreSQL log file patterns."""
         return ["*.log", "postgresql-*.log", "postgresql*.log"]
 
-    def parse(self) -> list[QueryLog]:
-        """Parse all PostgreSQL log files."""
-        queries = []
-        for log_file in self.get_log_files():
-            queries.extend(self.parse_file(log_file))
-        return queries
-
     def parse_file(self, file_path: Path) -> Iterator[QueryLog]:
         """Parse a single PostgreSQL log file."""
-        current_entry: dict = {}
+        current_entry: _PgEntry | None = None
         continuation_buffer: list[str] = []
 
-        with open(file_path, "r", encoding="utf-8", errors="replace") as f:
+        with open(
+            file_path, "r", encoding="utf-8", errors="replace", buffering=READ_BUFFER_SIZE
+        ) as f:
             for line in f:
                 line = line.rstrip()
 
                 # Try to match a new log entry
-                match = self.LOG_LINE_PATTERN.match(line)
+                entry = self._match_line(line)
 
-                if match:
+                if entry is not None:
                     # Process previous entry if exists
-                    if current_entry and continuation_buffer:
+                    if current_entry is not None:
                         query = self._build_query_log(current_entry, continuation_buffer)
                         if query:
                             yield query
 
                     # Start new entry
-                    current_entry = match.groupdict()
-                    continuation_buffer = [current_entry.get("message", "")]
-                elif current_entry:
-                    # Continuation of previous entry
-                    continuation_buffer.append(line)
+                    current_entry = entry
+                    continuation_buffer = [entry.message]
+                elif current_entry is not None:
+                    # Continuation of previous entry, stripped once here
+                    line = line.lstrip()
+                    if line:
+                        continuation_buffer.append(line)
 
             # Process last entry
-            if current_entry and continuation_buffer:
+            if current_entry is not None:
                 query = self._build_query_log(current_entry, continuation_buffer)
                 if query:
                     yield query
 
-    def _build_query_log(self, entry: dict, message_lines: list[str]) -> QueryLog | None:
+    def _match_line(self, line: str) -> _PgEntry | None:
+        """Return the fields of a log line prefix, or None for a continuation line."""
+        # Every entry starts with a year; anything else continues the previous one
+        if not line[:4].isdigit():
+            return None
+
+        entry = self._scan_line(line)
+        if entry is None:
+            match = self.LOG_LINE_PATTERN.match(line)
+            entry = _PgEntry(**match.groupdict()) if match else None
+        return entry
+
+    def _scan_line(self, line: str) -> _PgEntry | None:
+        """
+        Split a well-formed log line prefix with string slicing.
+
+        Returns None when the line does not have the usual shape, in which
+        case the caller falls back to LOG_LINE_PATTERN.
+        """
+        # "YYYY-MM-DD HH:MM:SS[.fff]" followed by a space
+        if len(line) < 20 or line[4] != "-" or line[10] != " " or line[13] != ":":
+            return None
+        ts_end = line.find(" ", 19)
+        if ts_end < 0:
+            return None
+        fraction = line[19:ts_end]
+        if fraction and not (fraction[0] == "." and fraction[1:].isdigit()):
+            return None
+
+        lb = line.find("[", ts_end)
+        rb = line.find("]", lb)
+        if lb < 0 or rb < 0:
+            return None
+        pid = line[lb + 1:rb]
+        timezone = line[ts_end:lb].strip()
+        if not pid.isdigit() or (timezone and not timezone.isalnum()):
+            return None
+
+        colon = line.find(":", rb)
+        if colon < 0 or colon + 1 >= len(line) or not line[colon + 1].isspace():
+            return None
+        head = line[rb + 1:colon].split()
+
+        user = database = None
+        if len(head) == 2:
+            user, at, database = head[0].partition("@")
+            if not at or not user.isidentifier() or not database.isidentifier():
+                return None
+        elif len(head) != 1:
+            return None
+        level = head[-1]
+        if level not in self.LOG_LEVELS:
+            return None
+
+        return _PgEntry(
+            timestamp=line[:ts_end],
+            timezone=timezone or None,
+            pid=pid,
+            user=user,
+            database=database,
+            level=level,
+            message=line[colon + 1:].lstrip(),
+        )
+
+    @staticmethod
+    def _has_statement(message: str) -> bool:
+        """Cheap pre-check for text that STATEMENT_PATTERN could match."""
+        lowered = message.lower()
+        return "statement:" in lowered or "execute" in lowered
+
+    def _build_query_log(self, entry: _PgEntry, message_lines: list[str]) -> QueryLog | None:
         """Build QueryLog from parsed entry."""
-        full_message = " ".join(line.strip() for line in message_lines if line.strip())
+        # Entries with no statement on any line (checkpoints, connections,
+        # plain durations) are skipped without joining their lines; the
+        # statement may start on a continuation line
+        if not any(map(self._has_statement, message_lines)):
+            return None
+        # message_lines are already stripped and non-empty
+        full_message = " ".join(message_lines)
 
         # Check for statement
         stmt_match = self.STATEMENT_PATTERN.search(full_message)
@@ -119,19 +266,7 @@ class PostgresLogParser(LogParser):
             return None
 
         # Parse timestamp
-        timestamp = None
-        if entry.get("timestamp"):
-            try:
-                # Handle various PostgreSQL timestamp formats
-                ts_str = entry["timestamp"]
-                for fmt in ["%Y-%m-%d %H:%M:%S.%f", "%Y-%m-%d %H:%M:%S"]:
-                    try:
-                        timestamp = datetime.strptime(ts_str.split()[0] + " " + ts_str.split()[1][:15], fmt)
-                        break
-                    except ValueError:
-                        continue
-            except (ValueError, IndexError):
-                pass
+        timestamp = _parse_pg_timestamp(entry.timestamp) if entry.timestamp else None
 
         # Parse duration
         duration_ms = None
@@ -146,8 +281,10 @@ class PostgresLogParser(LogParser):
             sql=sql,
             timestamp=timestamp,
             duration_ms=duration_ms,
-            user=entry.get("user"),
-            database=entry.get("database"),
+            # A log has only a few distinct users and databases; interning
+            # shares one string object across all queries
+            user=sys.intern(entry.user) if entry.user else None,
+            database=sys.intern(entry.database) if entry.database else None,
         )
 
 
@@ -175,56 +312,61 @@ class MySQLLogParser(LogParser):
         """MySQL log file patterns."""
         return ["*.log", "slow*.log", "mysql-slow*.log", "general*.log"]
 
-    def parse(self) -> list[QueryLog]:
-        """Parse all MySQL log files."""
-        queries = []
-        for log_file in self.get_log_files():
-            queries.extend(self.parse_file(log_file))
-        return queries
-
     def parse_file(self, file_path: Path) -> Iterator[QueryLog]:
         """Parse a single MySQL log file."""
-        current_entry: dict = {}
+        current_entry: _MySQLEntry | None = None
         sql_buffer: list[str] = []
 
-        with open(file_path, "r", encoding="utf-8", errors="replace") as f:
+        with open(
+            file_path, "r", encoding="utf-8", errors="replace", buffering=READ_BUFFER_SIZE
+        ) as f:
             for line in f:
                 line = line.rstrip()
 
-                # Check for time marker (new entry)
-                time_match = self.TIME_PATTERN.match(line)
-                if time_match:
-                    # Process previous entry
-                    if current_entry and sql_buffer:
-                        query = self._build_query_log(current_entry, sql_buffer)
-                        if query:
-                            yield query
-
-                    current_entry = {"timestamp": time_match.group("timestamp")}
-                    sql_buffer = []
-                    continue
+                # Header lines all start with "#"; dispatch on the label so
+                # each one is matched against a single pattern and SQL lines
+                # skip the header patterns entirely
+                if line.startswith("#"):
+                    label = line[1:].lstrip()
+
+                    # Check for time marker (new entry)
+                    time_match = label.startswith("Time:") and self.TIME_PATTERN.match(line)
+                    if time_match:
+                        # Process previous entry
+                        if current_entry is not None and sql_buffer:
+                            query = self._build_query_log(current_entry, sql_buffer)
+                            if query:
+                                yield query
+
+                        current_entry = _MySQLEntry(timestamp=time_match.group("timestamp"))
+                        sql_buffer = []
+                        continue
 
-                # Check for user info
-                user_match = self.USER_PATTERN.match(line)
-                if user_match:
-                    current_entry["user"] = user_match.group("user")
-                    current_entry["host"] = user_match.group("host")
-                    continue
+                    # Check for user info
+                    user_match = label.startswith("User@Host:") and self.USER_PATTERN.match(line)
+                    if user_match:
+                        if current_entry is None:
+                            current_entry = _MySQLEntry()
+                        current_entry.user = user_match.group("user")
+                        current_entry.host = user_match.group("host")
+                        continue
 
-                # Check for query time info
-                qt_match = self.QUERY_TIME_PATTERN.match(line)
-                if qt_match:
-                    current_entry["query_time"] = qt_match.group("query_time")
-                    current_entry["rows_sent"] = qt_match.group("rows_sent")
-                    current_entry["rows_examined"] = qt_match.group("rows_examined")
+                    # Check for query time info
+                    qt_match = (
+                        label.startswith("Query_time:") and self.QUERY_TIME_PATTERN.match(line)
+                    )
+                    if qt_match:
+                        if current_entry is None:
+                            current_entry = _MySQLEntry()
+                        current_entry.query_time = qt_match.group("query_time")
+                        current_entry.rows_sent = qt_match.group("rows_sent")
+                        current_entry.rows_examined = qt_match.group("rows_examined")
+
+                    # Skip other comment lines
                     continue
 
                 # Skip SET timestamp lines
-                if self.SET_TIMESTAMP_PATTERN.match(line):
-                    continue
-
-                # Skip comment lines
-                if line.startswith("#"):
+                if line[:3].upper() == "SET" and self.SET_TIMESTAMP_PATTERN.match(line):
                     continue
 
                 # Accumulate SQL
@@ -232,12 +374,12 @@ class MySQLLogParser(LogParser):
                     sql_buffer.append(line)
 
             # Process last entry
-            if current_entry and sql_buffer:
+            if current_entry is not None and sql_buffer:
                 query = self._build_query_log(current_entry, sql_buffer)
                 if query:
                     yield query
 
-    def _build_query_log(self, entry: dict, sql_lines: list[str]) -> QueryLog | None:
+    def _build_query_log(self, entry: _MySQLEntry, sql_lines: list[str]) -> QueryLog | None:
         """Build QueryLog from parsed entry."""
         sql = " ".join(sql_lines).strip()
 
@@ -253,26 +395,26 @@ class MySQLLogParser(LogParser):
 
         # Parse timestamp
         timestamp = None
-        if entry.get("timestamp"):
+        if entry.timestamp:
             try:
-                ts_str = entry["timestamp"].replace("T", " ").replace("Z", "")
+                ts_str = entry.timestamp.replace("T", " ").replace("Z", "")
                 timestamp = datetime.fromisoformat(ts_str)
             except ValueError:
                 pass
 
         # Parse duration (MySQL reports in seconds)
         duration_ms = None
-        if entry.get("query_time"):
+        if entry.query_time:
             try:
-                duration_ms = float(entry["query_time"]) * 1000
+                duration_ms = float(entry.query_time) * 1000
             except ValueError:
                 pass
 
         # Parse rows affected
         rows_affected = None
-        if entry.get("rows_sent"):
+        if entry.rows_sent:
             try:
-                rows_affected = int(entry["rows_sent"])
+                rows_affected = int(entry.rows_sent)
             except ValueError:
                 pass
 
@@ -281,10 +423,42 @@ class MySQLLogParser(LogParser):
             timestamp=timestamp,
             duration_ms=duration_ms,
             rows_affected=rows_affected,
-            user=entry.get("user"),
+            user=sys.intern(entry.user) if entry.user else None,
         )
 
 
+def _parse_pg_timestamp(ts_str: str) -> datetime | None:
+    """
+    Parse a PostgreSQL 'YYYY-MM-DD HH:MM:SS[.ffffff]' timestamp.
+
+    The layout is fixed, so fields are sliced and converted directly rather
+    than going through strptime. Fractions beyond microseconds are truncated.
+    """
+    date, _, time = ts_str.partition(" ")
+    time = time.lstrip()
+    if (
+        len(date) != 10 or date[4] != "-" or date[7] != "-"
+        or len(time) < 8 or time[2] != ":" or time[5] != ":"
+        or (len(time) > 8 and time[8] != ".")
+    ):
+        return None
+
+    fraction = time[9:15]
+    try:
+        return datetime(
+            int(date[:4]), int(date[5:7]), int(date[8:]),
+            int(time[:2]), int(time[3:5]), int(time[6:8]),
+            int(fraction.ljust(6, "0")) if fraction else 0,
+        )
+    except ValueError:
+        return None
+
+
+def _parse_file(parser: LogParser, file_path: Path) -> list[QueryLog]:
+    """Process-pool worker: parse one log file."""
+    return list(parser.parse_file(file_path))
+
+
 def get_parser(db_type: str, logs_dir: Path | str) -> LogParser:
     """Factory function to get appropriate log parser."""
     parsers = {
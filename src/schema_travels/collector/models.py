@@ -1,10 +1,23 @@
 """Data models for the collector module."""
 
+import re
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from typing import Any
 
+# String literals, numeric literals and whitespace runs, matched in one pass
+# by _normalize_sql_cached; _NORM_REPL is indexed by the matching group
+_NORM_RE = re.compile(r"('[^']*')|(\b\d+\b)|(\s+)")
+_NORM_REPL = (None, "'?'", "?", " ")
+
+
+@lru_cache(maxsize=100_000)
+def _normalize_sql_cached(sql: str) -> str:
+    """Normalize SQL by replacing literals (cached; logs repeat statements)."""
+    return _NORM_RE.sub(lambda m: _NORM_REPL[m.lastindex], sql).strip()
+
 
 class QueryType(Enum):
     """Type of SQL query."""
@@ -15,8 +28,19 @@ class QueryType(Enum):
     OTHER = "OTHER"
 
 
-@dataclass
-class QueryLog:
+_KEYWORD_TYPES = {
+    t.value: t for t in (QueryType.SELECT, QueryType.INSERT, QueryType.UPDATE, QueryType.DELETE)
+}
+
+
+class _DerivedQuerySlots:
+    """Storage for QueryLog's derived values, kept out of its dataclass fields."""
+
+    __slots__ = ("_query_type", "_normalized_sql")
+
+
+@dataclass(slots=True, init=False, repr=False)
+class QueryLog(_DerivedQuerySlots):
     """Represents a parsed query from database logs."""
     
     sql: str
@@ -25,41 +49,72 @@ class QueryLog:
     rows_affected: int | None = None
     user: str | None = None
     database: str | None = None
-    
-    # Computed fields
-    query_type: QueryType = field(default=QueryType.OTHER)
-    normalized_sql: str = ""
-    
-    def __post_init__(self):
-        """Compute derived fields."""
-        sql_upper = self.sql.strip().upper()
-        if sql_upper.startswith("SELECT"):
-            self.query_type = QueryType.SELECT
-        elif sql_upper.startswith("INSERT"):
-            self.query_type = QueryType.INSERT
-        elif sql_upper.startswith("UPDATE"):
-            self.query_type = QueryType.UPDATE
-        elif sql_upper.startswith("DELETE"):
-            self.query_type = QueryType.DELETE
-        
-        # Basic normalization (replace literals with placeholders)
-        self.normalized_sql = self._normalize_sql(self.sql)
-    
-    def _normalize_sql(self, sql: str) -> str:
-        """Normalize SQL by replacing literals with placeholders."""
-        import re
-        
-        # Replace string literals
-        normalized = re.sub(r"'[^']*'", "'?'", sql)
-        # Replace numeric literals
-        normalized = re.sub(r"\b\d+\b", "?", normalized)
-        # Normalize whitespace
-        normalized = " ".join(normalized.split())
-        
-        return normalized
-
-
-@dataclass
+
+    def __init__(
+        self,
+        sql: str,
+        timestamp: datetime | None = None,
+        duration_ms: float | None = None,
+        rows_affected: int | None = None,
+        user: str | None = None,
+        database: str | None = None,
+        query_type: QueryType | None = None,
+        normalized_sql: str | None = None,
+    ) -> None:
+        """
+        Initialize a query log entry.
+
+        query_type and normalized_sql may be supplied; otherwise they are
+        computed on first access, so queries that are never classified or
+        normalized cost nothing beyond construction.
+        """
+        self.sql = sql
+        self.timestamp = timestamp
+        self.duration_ms = duration_ms
+        self.rows_affected = rows_affected
+        self.user = user
+        self.database = database
+        self._query_type = query_type
+        self._normalized_sql = normalized_sql
+
+    def __repr__(self) -> str:
+        return (
+            f"QueryLog(sql={self.sql!r}, timestamp={self.timestamp!r}, "
+            f"duration_ms={self.duration_ms!r}, rows_affected={self.rows_affected!r}, "
+            f"user={self.user!r}, database={self.database!r}, "
+            f"query_type={self.query_type!r}, normalized_sql={self.normalized_sql!r})"
+        )
+
+    @property
+    def query_type(self) -> QueryType:
+        """Statement type, from the leading keyword of the SQL."""
+        if self._query_type is None:
+            # Skip leading whitespace and parentheses without copying the
+            # SQL, then uppercase only the six characters of the keyword
+            sql = self.sql
+            i, n = 0, len(sql)
+            while i < n and sql[i] in " \t\r\n(":
+                i += 1
+            self._query_type = _KEYWORD_TYPES.get(sql[i:i + 6].upper(), QueryType.OTHER)
+        return self._query_type
+
+    @query_type.setter
+    def query_type(self, value: QueryType) -> None:
+        self._query_type = value
+
+    @property
+    def normalized_sql(self) -> str:
+        """SQL with literals replaced by placeholders."""
+        if self._normalized_sql is None:
+            self._normalized_sql = _normalize_sql_cached(self.sql)
+        return self._normalized_sql
+
+    @normalized_sql.setter
+    def normalized_sql(self, value: str) -> None:
+        self._normalized_sql = value
+
+
+@dataclass(slots=True)
 class ColumnDefinition:
     """Represents a column in a table."""
     
@@ -70,7 +125,7 @@ class ColumnDefinition:
     is_primary_key: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ForeignKeyDefinition:
     """Represents a foreign key relationship."""
     
@@ -81,7 +136,7 @@ class ForeignKeyDefinition:
     to_columns: list[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class IndexDefinition:
     """Represents an index on a table."""
     
@@ -92,7 +147,7 @@ class IndexDefinition:
     is_primary: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class TableDefinition:
     """Represents a table definition."""
     
@@ -100,37 +155,67 @@ class TableDefinition:
     columns: list[ColumnDefinition] = field(default_factory=list)
     primary_key: list[str] = field(default_factory=list)
     indexes: list[IndexDefinition] = field(default_factory=list)
+
+    # Lowercase name -> column, built on the first get_column call; call
+    # reset_indexes() after changing columns
+    _column_index: dict[str, ColumnDefinition] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
     def get_column(self, name: str) -> ColumnDefinition | None:
-        """Get column by name."""
-        for col in self.columns:
-            if col.name.lower() == name.lower():
-                return col
-        return None
+        """Get column by name (case-insensitive)."""
+        if self._column_index is None:
+            # Reversed so the first of any same-named columns wins
+            self._column_index = {col.name.lower(): col for col in reversed(self.columns)}
+        return self._column_index.get(name.lower())
 
+    def reset_indexes(self) -> None:
+        """Drop the lookup index so it is rebuilt from the current columns."""
+        self._column_index = None
 
-@dataclass
+
+@dataclass(slots=True)
 class SchemaDefinition:
     """Represents a complete database schema."""
     
     tables: list[TableDefinition] = field(default_factory=list)
     foreign_keys: list[ForeignKeyDefinition] = field(default_factory=list)
     source_file: str | None = None
+
+    # Lowercase name -> table and lowercase table name -> foreign keys
+    # involving it, built on first use; call reset_indexes() after changing
+    # tables or foreign_keys
+    _table_index: dict[str, TableDefinition] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _fk_index: dict[str, list[ForeignKeyDefinition]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
     def get_table(self, name: str) -> TableDefinition | None:
-        """Get table by name."""
-        for table in self.tables:
-            if table.name.lower() == name.lower():
-                return table
-        return None
+        """Get table by name (case-insensitive)."""
+        if self._table_index is None:
+            # Reversed so the first of any same-named tables wins
+            self._table_index = {table.name.lower(): table for table in reversed(self.tables)}
+        return self._table_index.get(name.lower())
+
+    def reset_indexes(self) -> None:
+        """Drop the lookup indexes so they are rebuilt from the current lists."""
+        self._table_index = None
+        self._fk_index = None
     
     def get_relationships(self, table_name: str) -> list[ForeignKeyDefinition]:
         """Get all foreign keys involving a table."""
-        return [
-            fk for fk in self.foreign_keys
-            if fk.from_table.lower() == table_name.lower()
-            or fk.to_table.lower() == table_name.lower()
-        ]
+        if self._fk_index is None:
+            fk_index: dict[str, list[ForeignKeyDefinition]] = {}
+            for fk in self.foreign_keys:
+                from_table = fk.from_table.lower()
+                to_table = fk.to_table.lower()
+                fk_index.setdefault(from_table, []).append(fk)
+                if to_table != from_table:
+                    fk_index.setdefault(to_table, []).append(fk)
+            self._fk_index = fk_index
+        return list(self._fk_index.get(table_name.lower(), ()))
     
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -165,7 +250,7 @@ class SchemaDefinition:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class CollectedData:
     """Complete collected data from a database."""
     
@@ -1,10 +1,19 @@
 """Schema parser module for extracting schema definitions from SQL DDL files."""
 
+import copy
 import re
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import cache, lru_cache
+from itertools import repeat
 from pathlib import Path
 
 import sqlglot
 from sqlglot import exp
+from sqlglot.dialects.dialect import Dialect
+from sqlglot.generator import Generator
 
 from schema_travels.collector.models import (
     ColumnDefinition,
@@ -14,6 +23,42 @@ from schema_travels.collector.models import (
     TableDefinition,
 )
 
+# Patterns for the regex fallback parser. Only the CREATE TABLE header is
+# matched; the column list is delimited by _scan_top_level
+_CREATE_TABLE_RE = re.compile(
+    r"CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?[`\"]?(\w+)[`\"]?\s*\(",
+    re.IGNORECASE,
+)
+# Inline REFERENCES in column definitions
+_REF_RE = re.compile(
+    r"(\w+)\s+\w+.*?REFERENCES\s+[`\"]?(\w+)[`\"]?\s*\(([^)]+)\)",
+    re.IGNORECASE,
+)
+# Table-level FOREIGN KEY constraints
+_FK_RE = re.compile(
+    r"FOREIGN\s+KEY\s*\(([^)]+)\)\s*REFERENCES\s+[`\"]?(\w+)[`\"]?\s*\(([^)]+)\)",
+    re.IGNORECASE,
+)
+# Tokens _scan_top_level cares about: quoted text and comments (matched
+# whole, to the end of the input if unterminated) and ( ) ,
+_DDL_TOKEN_RE = re.compile(
+    r"'[^']*'?|\"[^\"]*\"?|`[^`]*`?|--[^\n]*\n?|/\*.*?(?:\*/|\Z)|[(),]",
+    re.DOTALL,
+)
+# Comments before a column definition, typically trailing the previous one
+_LEADING_COMMENTS_RE = re.compile(r"(?:\s*(?:--[^\n]*|/\*.*?\*/))+", re.DOTALL)
+# One column definition: name, type with optional size, then constraints
+_COLUMN_RE = re.compile(r"[`\"]?(\w+)[`\"]?\s+(\w+(?:\([^)]+\))?)\s*(.*)", re.IGNORECASE)
+
+
+@dataclass(slots=True)
+class _CreateNodes:
+    """Nodes of one CREATE statement, collected in a single tree walk."""
+
+    schema: exp.Schema | None = None
+    column_defs: list[exp.ColumnDef] = field(default_factory=list)
+    foreign_keys: list[exp.ForeignKey] = field(default_factory=list)
+
 
 class SchemaParser:
     """Parser for SQL DDL schema files."""
@@ -23,15 +68,42 @@ class SchemaParser:
         self.dialect = dialect
 
     def parse_file(self, schema_file: Path | str) -> SchemaDefinition:
-        """Parse a SQL schema file."""
+        """
+        Parse a SQL schema file.
+
+        Results are cached per process by path, modification time, size and
+        dialect, so re-parsing an unchanged file is a lookup. Each call
+        returns its own copy, which the caller may modify.
+        """
         schema_file = Path(schema_file)
         if not schema_file.exists():
             raise FileNotFoundError(f"Schema file not found: {schema_file}")
 
-        with open(schema_file, "r", encoding="utf-8") as f:
-            sql_content = f.read()
+        stat = schema_file.stat()
+        schema = _parse_file_cached(
+            str(schema_file), stat.st_mtime_ns, stat.st_size, self.dialect
+        )
+        return copy.deepcopy(schema)
+
+    def parse_files(
+        self, schema_files: list[Path | str], workers: int = 1
+    ) -> list[SchemaDefinition]:
+        """
+        Parse several SQL schema files.
+
+        Args:
+            schema_files: Schema files to parse
+            workers: Number of processes to parse files in; each file is
+                     parsed by a single process (1 = parse in this process)
+
+        Returns:
+            One schema per file, in the same order
+        """
+        if workers > 1 and len(schema_files) > 1:
+            with ProcessPoolExecutor(max_workers=min(workers, len(schema_files))) as executor:
+                return list(executor.map(_parse_schema_file, repeat(self), schema_files))
 
-        return self.parse_sql(sql_content, source_file=str(schema_file))
+        return [self.parse_file(schema_file) for schema_file in schema_files]
 
     def parse_sql(self, sql_content: str, source_file: str | None = None) -> SchemaDefinition:
         """Parse SQL DDL content."""
@@ -51,12 +123,13 @@ class SchemaParser:
                 continue
 
             if isinstance(stmt, exp.Create):
-                table_def = self._parse_create_table(stmt)
+                nodes = self._collect_create_nodes(stmt)
+                table_def = self._parse_create_table(stmt, nodes)
                 if table_def and table_def.name:  # Only add if we got a valid name
                     tables.append(table_def)
 
                     # Extract inline foreign keys
-                    inline_fks = self._extract_inline_foreign_keys(stmt, table_def.name)
+                    inline_fks = self._extract_inline_foreign_keys(nodes, table_def.name)
                     foreign_keys.extend(inline_fks)
 
             elif isinstance(stmt, exp.Index):
@@ -69,12 +142,12 @@ class SchemaParser:
         if not tables:
             return self._parse_with_regex(sql_content, source_file)
 
-        # Attach indexes to tables
+        # Attach indexes to tables (reversed so the first same-named table wins)
+        tables_by_name = {table.name.lower(): table for table in reversed(tables)}
         for idx in indexes:
-            for table in tables:
-                if table.name.lower() == idx.table.lower():
-                    table.indexes.append(idx)
-                    break
+            table = tables_by_name.get(idx.table.lower())
+            if table is not None:
+                table.indexes.append(idx)
 
         return SchemaDefinition(
             tables=tables,
@@ -84,24 +157,27 @@ class SchemaParser:
 
     def _get_table_name(self, table_expr) -> str:
         """Extract table name from various sqlglot expression types."""
-        if table_expr is None:
+        # Common case: a plain table reference
+        if isinstance(table_expr, exp.Table):
+            name = table_expr.name
+            if name:
+                return name
+        elif table_expr is None:
             return ""
-        
+
         # Try different ways to get the name
-        if hasattr(table_expr, "name") and table_expr.name:
-            return table_expr.name
-        
-        if hasattr(table_expr, "this"):
-            if hasattr(table_expr.this, "name") and table_expr.this.name:
-                return table_expr.this.name
-            if isinstance(table_expr.this, str):
-                return table_expr.this
-        
-        # Try to get from Table expression
-        if isinstance(table_expr, exp.Table):
-            if hasattr(table_expr, "name") and table_expr.name:
-                return table_expr.name
-        
+        name = getattr(table_expr, "name", None)
+        if name:
+            return name
+
+        inner = getattr(table_expr, "this", None)
+        if inner is not None:
+            if isinstance(inner, str):
+                return inner
+            name = getattr(inner, "name", None)
+            if name:
+                return name
+
         # Last resort: convert to string and extract
         table_str = str(table_expr)
         # Remove schema prefix if present (e.g., "public.users" -> "users")
@@ -111,7 +187,22 @@ class SchemaParser:
         table_str = table_str.strip("`\"'")
         return table_str
 
-    def _parse_create_table(self, stmt: exp.Create) -> TableDefinition | None:
+    @staticmethod
+    def _collect_create_nodes(stmt: exp.Create) -> _CreateNodes:
+        """Walk a CREATE statement once, keeping the nodes the parser needs."""
+        # walk() is breadth-first like find()/find_all(), so the first
+        # Schema and the node order match what those calls would return
+        nodes = _CreateNodes()
+        for node in stmt.walk():
+            if isinstance(node, exp.ColumnDef):
+                nodes.column_defs.append(node)
+            elif isinstance(node, exp.ForeignKey):
+                nodes.foreign_keys.append(node)
+            elif isinstance(node, exp.Schema) and nodes.schema is None:
+                nodes.schema = node
+        return nodes
+
+    def _parse_create_table(self, stmt: exp.Create, nodes: _CreateNodes) -> TableDefinition | None:
         """Parse a CREATE TABLE statement."""
         if not stmt.this:
             return None
@@ -125,7 +216,7 @@ class SchemaParser:
         primary_key: list[str] = []
 
         # Get table expression (Schema contains the column definitions)
-        table_expr = stmt.find(exp.Schema)
+        table_expr = nodes.schema
         if not table_expr:
             return TableDefinition(name=table_name, columns=[], primary_key=[])
 
@@ -160,7 +251,10 @@ class SchemaParser:
         data_type = "TEXT"  # Default
         kind = col_expr.args.get("kind")
         if kind:
-            data_type = kind.sql(dialect=self.dialect)
+            # Skip the defensive copy: generating SQL does not mutate the
+            # node, and the column defs are read again afterwards by
+            # _extract_inline_foreign_keys, so they must stay intact
+            data_type = _generator(self.dialect).generate(kind, copy=False)
 
         # Check constraints
         nullable = True
@@ -176,7 +270,7 @@ class SchemaParser:
                     is_primary_key = True
                     nullable = False
                 elif isinstance(constraint_kind, exp.DefaultColumnConstraint):
-                    default = str(constraint_kind.this) if constraint_kind.this else None
+                    default = _sql_text(constraint_kind.this) if constraint_kind.this else None
 
         return ColumnDefinition(
             name=col_name,
@@ -186,13 +280,15 @@ class SchemaParser:
             is_primary_key=is_primary_key,
         )
 
-    def _extract_inline_foreign_keys(self, stmt: exp.Create, table_name: str) -> list[ForeignKeyDefinition]:
+    def _extract_inline_foreign_keys(
+        self, nodes: _CreateNodes, table_name: str
+    ) -> list[ForeignKeyDefinition]:
         """Extract inline foreign key definitions from CREATE TABLE."""
         foreign_keys = []
 
         # Look for REFERENCES in column constraints (inline FK)
-        for col_def in stmt.find_all(exp.ColumnDef):
-            col_name = col_def.name if hasattr(col_def, "name") else None
+        for col_def in nodes.column_defs:
+            col_name = col_def.name
             if not col_name:
                 continue
             
@@ -217,7 +313,7 @@ class SchemaParser:
                         ))
 
         # Look for table-level FOREIGN KEY constraints
-        for fk_expr in stmt.find_all(exp.ForeignKey):
+        for fk_expr in nodes.foreign_keys:
             fk_def = self._parse_foreign_key(fk_expr, table_name)
             if fk_def:
                 foreign_keys.append(fk_def)
@@ -271,15 +367,7 @@ class SchemaParser:
         tables: list[TableDefinition] = []
         foreign_keys: list[ForeignKeyDefinition] = []
 
-        # Simple CREATE TABLE pattern
-        create_table_pattern = re.compile(
-            r"CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?[`\"]?(\w+)[`\"]?\s*\((.*?)\)\s*;",
-            re.IGNORECASE | re.DOTALL,
-        )
-
-        for match in create_table_pattern.finditer(sql_content):
-            table_name = match.group(1)
-            columns_str = match.group(2)
+        for table_name, columns_str in _scan_create_tables(sql_content):
 
             columns = self._parse_columns_regex(columns_str)
             primary_key = [c.name for c in columns if c.is_primary_key]
@@ -293,11 +381,7 @@ class SchemaParser:
             )
 
             # Extract inline REFERENCES in column definitions
-            ref_pattern = re.compile(
-                r"(\w+)\s+\w+.*?REFERENCES\s+[`\"]?(\w+)[`\"]?\s*\(([^)]+)\)",
-                re.IGNORECASE,
-            )
-            for ref_match in ref_pattern.finditer(columns_str):
+            for ref_match in _REF_RE.finditer(columns_str):
                 from_col = ref_match.group(1)
                 to_table = ref_match.group(2)
                 to_cols = [c.strip().strip("`\"") for c in ref_match.group(3).split(",")]
@@ -313,11 +397,7 @@ class SchemaParser:
                 )
 
             # Extract table-level FOREIGN KEY constraints
-            fk_pattern = re.compile(
-                r"FOREIGN\s+KEY\s*\(([^)]+)\)\s*REFERENCES\s+[`\"]?(\w+)[`\"]?\s*\(([^)]+)\)",
-                re.IGNORECASE,
-            )
-            for fk_match in fk_pattern.finditer(columns_str):
+            for fk_match in _FK_RE.finditer(columns_str):
                 from_cols = [c.strip().strip("`\"") for c in fk_match.group(1).split(",")]
                 to_table = fk_match.group(2)
                 to_cols = [c.strip().strip("`\"") for c in fk_match.group(3).split(",")]
@@ -342,35 +422,14 @@ class SchemaParser:
         """Parse columns using regex."""
         columns = []
 
-        # Split by comma, but respect parentheses
-        parts = []
-        current = []
-        depth = 0
-        for char in columns_str:
-            if char == "(":
-                depth += 1
-            elif char == ")":
-                depth -= 1
-            elif char == "," and depth == 0:
-                parts.append("".join(current).strip())
-                current = []
-                continue
-            current.append(char)
-        if current:
-            parts.append("".join(current).strip())
-
-        for part in parts:
+        for part in _split_top_level(columns_str):
             # Skip constraints
             part_upper = part.strip().upper()
             if part_upper.startswith(("PRIMARY KEY", "FOREIGN KEY", "UNIQUE", "CHECK", "CONSTRAINT")):
                 continue
 
             # Parse column definition
-            col_match = re.match(
-                r"[`\"]?(\w+)[`\"]?\s+(\w+(?:\([^)]+\))?)\s*(.*)",
-                part.strip(),
-                re.IGNORECASE,
-            )
+            col_match = _COLUMN_RE.match(part.strip())
             if col_match:
                 name = col_match.group(1)
                 data_type = col_match.group(2)
@@ -389,3 +448,91 @@ class SchemaParser:
                 )
 
         return columns
+
+
+def _scan_top_level(text: str, start: int = 0) -> Iterator[int]:
+    """
+    Yield positions of top-level commas in text[start:].
+
+    If a ')' closes the group that text[start:] is inside of, its position
+    is yielded last. Parentheses and commas inside quoted strings,
+    quoted identifiers and comments are ignored; those tokens simply fall
+    through the loop. _DDL_TOKEN_RE skips all other text inside the regex
+    engine, so Python only handles one iteration per token.
+    """
+    depth = 0
+    for token in _DDL_TOKEN_RE.finditer(text, start):
+        char = token.group()
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            if depth == 0:
+                yield token.start()
+                return
+            depth -= 1
+        elif char == "," and depth == 0:
+            yield token.start()
+
+
+def _scan_create_tables(sql_content: str) -> Iterator[tuple[str, str]]:
+    """Yield (table name, column list text) for each CREATE TABLE statement."""
+    pos = 0
+    while match := _CREATE_TABLE_RE.search(sql_content, pos):
+        body_start = match.end()
+        # Only the last position matters: the closing ')' if there is one
+        last = deque(_scan_top_level(sql_content, body_start), maxlen=1)
+        if not last or sql_content[last[0]] != ")":
+            # Unterminated column list; skip this statement only
+            pos = body_start
+            continue
+        end = last[0]
+        yield match.group(1), sql_content[body_start:end]
+        pos = end + 1
+
+
+def _split_top_level(text: str) -> list[str]:
+    """
+    Split text on top-level commas into stripped, non-empty parts.
+
+    Comments at the start of a part are dropped.
+    """
+    parts = []
+    prev = 0
+    for end in (*_scan_top_level(text), len(text)):
+        part = text[prev:end]
+        if comments := _LEADING_COMMENTS_RE.match(part):
+            part = part[comments.end():]
+        part = part.strip()
+        if part:
+            parts.append(part)
+        prev = end + 1
+    return parts
+
+
+@cache
+def _generator(dialect: str | None) -> Generator:
+    """Return a shared SQL generator for a dialect (None for sqlglot's default)."""
+    return Dialect.get_or_raise(dialect).generator()
+
+
+def _sql_text(node: exp.Expression | str) -> str:
+    """Render a node as str() would, without building a new generator."""
+    if isinstance(node, exp.Expression):
+        return _generator(None).generate(node, copy=False)
+    return str(node)
+
+
+def _parse_schema_file(parser: SchemaParser, schema_file: Path | str) -> SchemaDefinition:
+    """Process-pool worker: parse one schema file."""
+    return parser.parse_file(schema_file)
+
+
+@lru_cache(maxsize=32)
+def _parse_file_cached(
+    schema_file: str, mtime_ns: int, size: int, dialect: str
+) -> SchemaDefinition:
+    """Parse a schema file; mtime and size are only part of the cache key."""
+    with open(schema_file, "r", encoding="utf-8") as f:
+        sql_content = f.read()
+
+    return SchemaParser(dialect=dialect).parse_sql(sql_content, source_file=schema_file)
@@ -3,7 +3,7 @@
 import os
 import sys
 from pathlib import Path
-from functools import lru_cache
+from functools import cached_property, lru_cache
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -73,9 +73,9 @@ class Settings(BaseSettings):
         description="Default source database type (postgres, mysql)",
     )
 
-    @property
+    @cached_property
     def db_path(self) -> Path:
-        """Get resolved database path."""
+        """Get resolved database path, creating its directory on first access."""
         path = Path(self.database_path).expanduser()
         path.parent.mkdir(parents=True, exist_ok=True)
         return path
@@ -110,7 +110,12 @@ class Settings(BaseSettings):
 
 @lru_cache
 def get_settings() -> Settings:
-    """Get cached settings instance."""
+    """
+    Get cached settings instance.
+
+    The environment is read once per process; tests that change it must
+    call get_settings.cache_clear() before and after.
+    """
     return Settings()
 
 
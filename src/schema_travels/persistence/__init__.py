@@ -1,9 +1,10 @@
 """Persistence module for SQLite storage."""
 
 from schema_travels.persistence.database import Database
-from schema_travels.persistence.repository import AnalysisRepository
+from schema_travels.persistence.repository import AnalysisRepository, get_repository
 
 __all__ = [
     "Database",
     "AnalysisRepository",
+    "get_repository",
 ]
@@ -1,6 +1,7 @@
 """SQLite database connection and schema management."""
 
 import sqlite3
+import threading
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Iterator
@@ -12,10 +13,10 @@ class Database:
     """
     SQLite database connection manager.
 
-    Handles connection pooling and schema initialization.
+    Keeps one open connection per thread and handles schema initialization.
     """
 
-    SCHEMA_VERSION = 1
+    SCHEMA_VERSION = 2
 
     SCHEMA_SQL = """
     -- Analysis runs
@@ -79,7 +80,22 @@ class Database:
 
     -- Indexes
     CREATE INDEX IF NOT EXISTS idx_analyses_created_at ON analyses(created_at);
-    CREATE INDEX IF NOT EXISTS idx_recommendations_analysis ON recommendations(analysis_id);
+    CREATE INDEX IF NOT EXISTS idx_recommendations_parent
+        ON recommendations(analysis_id, parent_table);
+    CREATE INDEX IF NOT EXISTS idx_simulations_analysis_created
+        ON simulations(analysis_id, created_at DESC);
+
+    -- Version 2: idx_recommendations_parent also serves analysis_id lookups
+    DROP INDEX IF EXISTS idx_recommendations_analysis;
+    """
+
+    # Children before parents, so foreign keys are never left dangling
+    CLEAR_SQL = """
+    DELETE FROM simulations;
+    DELETE FROM target_schemas;
+    DELETE FROM recommendations;
+    DELETE FROM analysis_results;
+    DELETE FROM analyses;
     """
 
     def __init__(self, db_path: Path | str | None = None):
@@ -90,11 +106,19 @@ class Database:
             db_path: Path to SQLite database file (defaults to config)
         """
         if db_path is None:
-            settings = get_settings()
-            db_path = settings.db_path
-
-        self.db_path = Path(db_path)
-        self._ensure_directory()
+            # Settings.db_path has already created the directory
+            self.db_path = get_settings().db_path
+        else:
+            self.db_path = Path(db_path)
+            self._ensure_directory()
+
+        # Per-thread connection ("conn") and open-transaction flag
+        # ("in_transaction"), both set on first use
+        self._local = threading.local()
+        # Every open connection, whichever thread opened it, so close()
+        # can close them all
+        self._connections: set[sqlite3.Connection] = set()
+        self._connections_lock = threading.Lock()
         self._init_schema()
 
     def _ensure_directory(self) -> None:
@@ -107,47 +131,93 @@ class Database:
             cursor = conn.cursor()
             cursor.executescript(self.SCHEMA_SQL)
 
-            # Check/update schema version
+            # Check/update schema version; SCHEMA_SQL is idempotent, so
+            # running it above has already migrated older databases
             cursor.execute(
                 "INSERT OR IGNORE INTO schema_version (version) VALUES (?)",
                 (self.SCHEMA_VERSION,),
             )
             conn.commit()
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open and configure a new connection."""
+        # Each connection is only used by the thread that opened it;
+        # check_same_thread is off so close() may close it from another
+        conn = sqlite3.connect(
+            self.db_path,
+            detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
+            check_same_thread=False,
+        )
+        conn.row_factory = sqlite3.Row
+        # WAL lets readers run while a write is in progress; NORMAL sync is
+        # durable across application crashes in WAL mode
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
+
     @contextmanager
     def connection(self) -> Iterator[sqlite3.Connection]:
         """
-        Get a database connection.
+        Get this thread's database connection.
+
+        The connection is opened on first use and kept open until close(),
+        so repeated operations do not pay for connecting.
 
         Yields:
             SQLite connection with row factory enabled
         """
-        conn = sqlite3.connect(
-            self.db_path,
-            detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
-        )
-        conn.row_factory = sqlite3.Row
+        conn = getattr(self._local, "conn", None)
+        if conn is None or conn not in self._connections:
+            # First use in this thread, or closed by close()
+            conn = self._local.conn = self._connect()
+            with self._connections_lock:
+                self._connections.add(conn)
+        yield conn
+
+    def close(self) -> None:
+        """
+        Close the connections of all threads.
 
-        try:
-            yield conn
-        finally:
+        The next operation in any thread reopens its connection. Call this
+        only when no other thread is in the middle of an operation.
+        """
+        with self._connections_lock:
+            connections, self._connections = self._connections, set()
+        self._local.conn = None
+        for conn in connections:
             conn.close()
 
+    def _in_transaction(self) -> bool:
+        """Whether this thread is inside transaction()."""
+        return getattr(self._local, "in_transaction", False)
+
     @contextmanager
     def transaction(self) -> Iterator[sqlite3.Connection]:
         """
         Get a database connection with automatic transaction handling.
 
+        Every operation on this database inside the block shares the
+        connection and is committed once at the end. Nested transactions
+        join the outermost one.
+
         Yields:
             SQLite connection that will commit on success or rollback on error
         """
         with self.connection() as conn:
+            if self._in_transaction():
+                yield conn
+                return
+
+            self._local.in_transaction = True
             try:
                 yield conn
                 conn.commit()
             except Exception:
                 conn.rollback()
                 raise
+            finally:
+                self._local.in_transaction = False
 
     def execute(
         self,
@@ -170,7 +240,8 @@ class Database:
                 cursor.execute(sql, params)
             else:
                 cursor.execute(sql)
-            conn.commit()
+            if not self._in_transaction():
+                conn.commit()
             return cursor
 
     def fetch_one(
@@ -221,10 +292,11 @@ class Database:
 
     def clear_all(self) -> None:
         """Clear all data from database (for testing)."""
-        with self.transaction() as conn:
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM simulations")
-            cursor.execute("DELETE FROM target_schemas")
-            cursor.execute("DELETE FROM recommendations")
-            cursor.execute("DELETE FROM analysis_results")
-            cursor.execute("DELETE FROM analyses")
+        with self.connection() as conn:
+            if self._in_transaction():
+                # executescript() would commit the caller's transaction first
+                for statement in self.CLEAR_SQL.split(";"):
+                    if statement.strip():
+                        conn.execute(statement)
+            else:
+                conn.executescript(f"BEGIN; {self.CLEAR_SQL} COMMIT;")
@@ -1,7 +1,12 @@
 """Repository for analysis data persistence."""
 
+import atexit
 import json
+import zlib
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 from schema_travels.analyzer.models import AnalysisResult
@@ -9,6 +14,25 @@ from schema_travels.recommender.models import SchemaRecommendation, TargetSchema
 from schema_travels.simulator.models import SimulationResult
 from schema_travels.persistence.database import Database
 
+# JSON payloads at least this long are stored as zlib-compressed BLOBs;
+# shorter ones stay plain TEXT, where compression would not pay off
+COMPRESS_MIN_LENGTH = 1024
+
+
+def _json_pack(obj: Any) -> str | bytes:
+    """Serialize a value for a *_json column."""
+    text = json.dumps(obj)
+    if len(text) < COMPRESS_MIN_LENGTH:
+        return text
+    return zlib.compress(text.encode())
+
+
+def _json_unpack(value: str | bytes | None) -> Any:
+    """Deserialize a *_json column written by _json_pack (or as plain TEXT)."""
+    if isinstance(value, bytes):
+        value = zlib.decompress(value)
+    return json.loads(value or "[]")
+
 
 class AnalysisRepository:
     """
@@ -27,6 +51,16 @@ class AnalysisRepository:
         """
         self.db = database or Database()
 
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Group several repository writes into a single commit.
+
+        Writes made inside the block are rolled back together if it raises.
+        """
+        with self.db.transaction():
+            yield
+
     def create_analysis(
         self,
         analysis_id: str,
@@ -116,10 +150,10 @@ class AnalysisRepository:
             """,
             (
                 result.analysis_id,
-                json.dumps([jp.to_dict() for jp in result.join_patterns]),
-                json.dumps([mp.to_dict() for mp in result.mutation_patterns]),
-                json.dumps([ap.to_dict() for ap in result.access_patterns]),
-                json.dumps([ts.to_dict() for ts in result.table_statistics]),
+                _json_pack([jp.to_dict() for jp in result.join_patterns]),
+                _json_pack([mp.to_dict() for mp in result.mutation_patterns]),
+                _json_pack([ap.to_dict() for ap in result.access_patterns]),
+                _json_pack([ts.to_dict() for ts in result.table_statistics]),
             ),
         )
 
@@ -159,8 +193,8 @@ class AnalysisRepository:
                         rec.child_table,
                         rec.decision.value,
                         rec.confidence,
-                        json.dumps(rec.reasoning),
-                        json.dumps(rec.warnings),
+                        _json_pack(rec.reasoning),
+                        _json_pack(rec.warnings),
                     ),
                 )
 
@@ -185,7 +219,7 @@ class AnalysisRepository:
             (
                 analysis_id,
                 schema.target_type.value,
-                json.dumps(schema.to_dict()),
+                _json_pack(schema.to_dict()),
             ),
         )
 
@@ -209,7 +243,7 @@ class AnalysisRepository:
             INSERT INTO simulations (analysis_id, result_json)
             VALUES (?, ?)
             """,
-            (analysis_id, json.dumps(result.to_dict())),
+            (analysis_id, _json_pack(result.to_dict())),
         )
         return cursor.lastrowid or 0
 
@@ -253,10 +287,10 @@ class AnalysisRepository:
 
         return {
             "analysis_id": row["analysis_id"],
-            "join_patterns": json.loads(row["join_patterns_json"] or "[]"),
-            "mutation_patterns": json.loads(row["mutation_patterns_json"] or "[]"),
-            "access_patterns": json.loads(row["access_patterns_json"] or "[]"),
-            "table_statistics": json.loads(row["table_statistics_json"] or "[]"),
+            "join_patterns": _json_unpack(row["join_patterns_json"]),
+            "mutation_patterns": _json_unpack(row["mutation_patterns_json"]),
+            "access_patterns": _json_unpack(row["access_patterns_json"]),
+            "table_statistics": _json_unpack(row["table_statistics_json"]),
         }
 
     def get_recommendations(self, analysis_id: str) -> list[dict[str, Any]]:
@@ -281,8 +315,8 @@ class AnalysisRepository:
                 "child_table": row["child_table"],
                 "decision": row["decision"],
                 "confidence": row["confidence"],
-                "reasoning": json.loads(row["reasoning_json"] or "[]"),
-                "warnings": json.loads(row["warnings_json"] or "[]"),
+                "reasoning": _json_unpack(row["reasoning_json"]),
+                "warnings": _json_unpack(row["warnings_json"]),
             }
             for row in rows
         ]
@@ -305,7 +339,7 @@ class AnalysisRepository:
         if not row:
             return None
 
-        return json.loads(row["schema_json"])
+        return _json_unpack(row["schema_json"])
 
     def get_simulations(self, analysis_id: str) -> list[dict[str, Any]]:
         """
@@ -326,7 +360,7 @@ class AnalysisRepository:
             {
                 "id": row["id"],
                 "created_at": row["created_at"],
-                "result": json.loads(row["result_json"]),
+                "result": _json_unpack(row["result_json"]),
             }
             for row in rows
         ]
@@ -401,3 +435,15 @@ class AnalysisRepository:
             )
 
             return True
+
+
+@lru_cache
+def get_repository() -> AnalysisRepository:
+    """
+    Get the repository for the configured database (created once per process).
+
+    Its connections are closed when the interpreter exits.
+    """
+    repo = AnalysisRepository()
+    atexit.register(repo.db.close)
+    return repo
@@ -12,6 +12,7 @@ import json
 import logging
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -398,6 +399,10 @@ class RecommendationCache:
         logger.info(f"Invalidated {count} cache entries")
         return count
     
+    def count(self) -> int:
+        """Number of cache entries, without building the entry list."""
+        return len(self._index.get("entries", {}))
+
     def list_entries(self) -> list[dict]:
         """List all cache entries."""
         return [
@@ -471,6 +476,7 @@ class RecommendationCache:
         }
 
 
+@lru_cache
 def get_cache() -> RecommendationCache:
-    """Get the global recommendation cache."""
+    """Get the global recommendation cache (created once per process)."""
     return RecommendationCache()
@@ -4,8 +4,6 @@ import json
 import logging
 from typing import Any
 
-from anthropic import Anthropic
-
 from schema_travels.config import get_settings, APIKeyNotConfiguredError
 from schema_travels.collector.models import SchemaDefinition
 from schema_travels.analyzer.models import AnalysisResult
@@ -50,6 +48,9 @@ class ClaudeAdvisor:
         if self.api_key in ("your-api-key-here", "sk-ant-xxxxx"):
             raise APIKeyNotConfiguredError()
 
+        # The SDK takes ~1s to import; only pay for it when a client is needed
+        from anthropic import Anthropic
+
         self.client = Anthropic(api_key=self.api_key)
 
     def get_recommendations(
@@ -316,11 +317,7 @@ Respond with JSON:
             )
 
         lines.append("\nTable Mutation Patterns:")
-        for mp in sorted(
-            analysis.mutation_patterns,
-            key=lambda m: m.total_operations,
-            reverse=True,
-        )[:10]:
+        for mp in analysis.top_mutations(10):
             lines.append(
                 f"- {mp.table}: reads={mp.select_count}, writes={mp.total_writes} "
                 f"({mp.write_ratio:.0%} write ratio)"
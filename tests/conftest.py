@@ -82,6 +82,7 @@ def test_database(temp_dir):
     db_path = temp_dir / "test.db"
     db = Database(db_path)
     yield db
+    db.close()
     # Cleanup happens automatically with temp_dir
 
 
@@ -4,11 +4,65 @@ import pytest
 from datetime import datetime
 
 from schema_travels.collector.models import QueryLog
-from schema_travels.analyzer.hot_joins import HotJoinAnalyzer
+from schema_travels.analyzer._names import lower_name
+from schema_travels.analyzer._parse_cache import _normalize, parse_sql
+from schema_travels.analyzer.hot_joins import HotJoinAnalyzer, _single_table
+from schema_travels.analyzer.models import AccessPattern
 from schema_travels.analyzer.mutations import MutationAnalyzer
 from schema_travels.analyzer.pattern_analyzer import PatternAnalyzer
 
 
+class TestParseCache:
+    """Tests for the shared SQL parse cache."""
+
+    def test_repeated_sql_reuses_ast(self):
+        """Test that identical SQL returns the same cached AST."""
+        first = parse_sql("SELECT * FROM users WHERE id = 1")
+        second = parse_sql("SELECT *  FROM users\n WHERE id = 1")
+        assert first is not None
+        assert first is second
+
+    def test_literals_share_cache_entry(self):
+        """Test that queries differing only in literals share one AST."""
+        first = parse_sql("SELECT * FROM users WHERE id = 1 AND name = 'a'")
+        second = parse_sql("SELECT * FROM users WHERE id = 42 AND name = 'bob'")
+        assert first is second
+
+    @pytest.mark.parametrize("literal", ["'it''s'", "'a'' OR ''b'"])
+    def test_doubled_quotes_stay_in_one_literal(self, literal):
+        """Test doubled quotes do not split a literal."""
+        sql = f"SELECT * FROM users WHERE name = {literal} AND id = 1"
+        assert _normalize(sql) == "SELECT * FROM users WHERE name = '?' AND id = 0"
+        assert parse_sql(sql) is parse_sql("SELECT * FROM users WHERE name = 'x' AND id = 2")
+
+    def test_trailing_backslash_ends_literal(self):
+        """Test a backslash is not treated as an escape inside a literal."""
+        sql = (
+            "SELECT * FROM files f JOIN dirs d ON f.dir_id = d.id"
+            " WHERE f.path = 'C:\\' AND d.name = 'x'"
+        )
+        assert _normalize(sql).endswith("WHERE f.path = '?' AND d.name = '?'")
+        assert parse_sql(sql) is not None
+
+    def test_quoted_identifiers_keep_digits(self):
+        """Test numbers inside quoted identifiers are not replaced."""
+        assert _normalize('SELECT * FROM "sales 2024" WHERE id = 7') == (
+            'SELECT * FROM "sales 2024" WHERE id = 0'
+        )
+        assert _normalize("SELECT * FROM `t1` WHERE id = 7") == "SELECT * FROM `t1` WHERE id = 0"
+
+    def test_unparseable_sql_returns_none(self):
+        """Test that unparseable SQL yields None instead of raising."""
+        assert parse_sql("SELECT FROM WHERE (((") is None
+
+    def test_lower_name_is_interned(self):
+        """Test that lowered names are shared string objects."""
+        first = lower_name("Users")
+        second = lower_name("USERS")
+        assert first == "users"
+        assert first is second
+
+
 class TestHotJoinAnalyzer:
     """Tests for HotJoinAnalyzer."""
 
@@ -41,6 +95,28 @@ class TestHotJoinAnalyzer:
         # Should detect join between users and orders
         assert len(result) >= 0  # Depends on parsing success
 
+    def test_join_without_on_uses_query_tables(self):
+        """Test that a join without ON falls back to the other query table."""
+        analyzer = HotJoinAnalyzer()
+        queries = [QueryLog(sql="SELECT * FROM users CROSS JOIN orders", duration_ms=3.0)]
+        result = analyzer.analyze(queries)
+
+        assert len(result) == 1
+        assert result[0].table_pair == ("orders", "users")
+        assert result[0].frequency == 1
+        assert result[0].cost_score == pytest.approx(3.0)
+
+    def test_get_hot_joins_returns_top_by_cost(self):
+        """Test that get_hot_joins returns the most expensive joins first."""
+        analyzer = HotJoinAnalyzer()
+        analyzer.analyze([
+            QueryLog(sql="SELECT * FROM users CROSS JOIN orders", duration_ms=1.0),
+            QueryLog(sql="SELECT * FROM orders CROSS JOIN items", duration_ms=9.0),
+        ])
+
+        top = analyzer.get_hot_joins(top_n=1)
+        assert [j.table_pair for j in top] == [("items", "orders")]
+
     def test_track_table_statistics(self):
         """Test table statistics tracking."""
         analyzer = HotJoinAnalyzer()
@@ -54,6 +130,75 @@ class TestHotJoinAnalyzer:
         stats = analyzer.get_table_statistics()
         assert len(stats) >= 0
 
+    def test_single_table_prefilter_matches_parse(self):
+        """Test that the regex fast path records the same stats as a parse."""
+        sqls = [
+            "SELECT * FROM Users u WHERE id = 1",
+            "SELECT * FROM users, orders WHERE users.id = orders.user_id",
+            "SELECT * FROM users WHERE id IN (SELECT user_id FROM orders)",
+        ]
+        fast = HotJoinAnalyzer()
+        fast.analyze([QueryLog(sql=sql, duration_ms=1.0) for sql in sqls])
+        parsed = HotJoinAnalyzer()
+        for sql in sqls:
+            parsed._process_parsed(parse_sql(sql), 1.0)
+
+        assert {t: s.to_dict() for t, s in fast.table_stats.items()} == {
+            t: s.to_dict() for t, s in parsed.table_stats.items()
+        }
+        assert fast.table_stats["users"].solo_accesses == 1
+
+    @pytest.mark.parametrize(
+        ("sql", "table"),
+        [
+            ("SELECT * FROM db.public.users", "users"),
+            ("SELECT * FROM public . users u WHERE id = 1", "users"),
+            ("SELECT * FROM generate_series(1, 10) g", None),
+            ("SELECT * FROM users WHERE (", None),
+            ("SELECT * FROM users WHERE name = 'x", None),
+        ],
+    )
+    def test_single_table_prefilter_cases(self, sql, table):
+        """Test the prefilter only accepts plain, well-formed table references."""
+        assert _single_table(sql) == table
+
+        fast = HotJoinAnalyzer()
+        fast.analyze([QueryLog(sql=sql, duration_ms=1.0)])
+        parsed = HotJoinAnalyzer()
+        parsed._process_parsed(parse_sql(sql), 1.0)
+        assert {t: s.to_dict() for t, s in fast.table_stats.items()} == {
+            t: s.to_dict() for t, s in parsed.table_stats.items()
+        }
+
+    def test_analyze_parsed_uses_given_ast(self, monkeypatch):
+        """Test that pre-parsed queries are analyzed from their AST, not the prefilter."""
+        query = QueryLog(sql="SELECT * FROM users WHERE id = 1", duration_ms=1.0)
+        analyzer = HotJoinAnalyzer()
+        monkeypatch.setattr(
+            "schema_travels.analyzer.hot_joins._single_table",
+            lambda sql: pytest.fail("prefilter used for a parsed query"),
+        )
+
+        analyzer.analyze_parsed([(query, parse_sql(query.sql))])
+
+        assert analyzer.table_stats["users"].solo_accesses == 1
+
+    def test_parallel_matches_serial(self):
+        """Test that splitting across workers gives the same counts."""
+        queries = [
+            QueryLog(sql="SELECT * FROM users CROSS JOIN orders", duration_ms=2.0),
+            QueryLog(sql="SELECT * FROM users", duration_ms=1.0),
+        ] * 4
+
+        serial = HotJoinAnalyzer()
+        serial_joins = serial.analyze(queries)
+        parallel = HotJoinAnalyzer()
+        parallel_joins = parallel.analyze(queries, workers=2)
+
+        assert [j.to_dict() for j in parallel_joins] == [j.to_dict() for j in serial_joins]
+        assert parallel.queries_processed == serial.queries_processed == 8
+        assert parallel.table_stats["users"].to_dict() == serial.table_stats["users"].to_dict()
+
 
 class TestMutationAnalyzer:
     """Tests for MutationAnalyzer."""
@@ -100,6 +245,62 @@ class TestMutationAnalyzer:
         assert "users" in result
         assert result["users"].update_count == 1
 
+    def test_update_separates_set_and_where_columns(self):
+        """Test that WHERE columns are not counted as updated columns."""
+        analyzer = MutationAnalyzer()
+        analyzer.analyze([
+            QueryLog(sql="UPDATE users SET name = 'new' WHERE id = 1 AND status = 'a'"),
+        ])
+
+        assert analyzer.updated_columns == {("users", "name"): 1}
+        assert analyzer.filtered_columns == {("users", "id"): 1, ("users", "status"): 1}
+
+    def test_parallel_matches_serial(self):
+        """Test that splitting across workers gives the same counts."""
+        queries = [
+            QueryLog(sql="SELECT * FROM users WHERE id = 1", duration_ms=1.0),
+            QueryLog(sql="UPDATE users SET name = 'x' WHERE id = 2", duration_ms=2.0),
+            QueryLog(sql="INSERT INTO logs (msg) VALUES ('a')", duration_ms=1.0),
+        ] * 3
+
+        serial = MutationAnalyzer()
+        serial.analyze(queries)
+        parallel = MutationAnalyzer()
+        parallel.analyze(queries, workers=2)
+
+        assert {t: p.to_dict() for t, p in parallel.patterns.items()} == {
+            t: p.to_dict() for t, p in serial.patterns.items()
+        }
+        assert parallel.get_mutation_report() == serial.get_mutation_report()
+
+    def test_warm_creates_empty_patterns(self):
+        """Test that warmed tables are reported even without queries."""
+        analyzer = MutationAnalyzer()
+        analyzer.warm(["Users", "orders"])
+        patterns = analyzer.analyze([
+            QueryLog(sql="DELETE FROM users WHERE id = 1", duration_ms=1.0),
+        ])
+
+        assert set(patterns) == {"users", "orders"}
+        assert patterns["users"].delete_count == 1
+        assert patterns["orders"].total_operations == 0
+
+    def test_threaded_parse_matches_serial(self):
+        """Test that parsing on a thread pool gives the same counts."""
+        queries = [
+            QueryLog(sql="SELECT * FROM users WHERE id = 1", duration_ms=1.0),
+            QueryLog(sql="DELETE FROM users WHERE id = 2", duration_ms=2.0),
+            QueryLog(sql="NOT VALID SQL ((("),
+        ]
+
+        serial = MutationAnalyzer()
+        serial.analyze(queries)
+        threaded = MutationAnalyzer()
+        threaded.analyze(queries, threads=2)
+
+        assert threaded.get_mutation_report() == serial.get_mutation_report()
+        assert threaded.queries_processed == 3
+
     def test_analyze_delete_queries(self):
         """Test analyzing DELETE queries."""
         analyzer = MutationAnalyzer()
@@ -185,3 +386,79 @@ class TestPatternAnalyzer:
         
         summary = analyzer.get_summary(result)
         assert "ACCESS PATTERN ANALYSIS SUMMARY" in summary
+
+    def test_reused_analyzer_starts_fresh(self):
+        """Test that a second analyze call does not accumulate counts."""
+        analyzer = PatternAnalyzer()
+        queries = [
+            QueryLog(sql="SELECT * FROM users u JOIN orders o ON u.id = o.user_id"),
+        ]
+        first = analyzer.analyze(queries)
+        second = analyzer.analyze(queries)
+
+        assert first.join_patterns[0].frequency == 1
+        assert second.join_patterns[0].frequency == 1
+        assert first.analysis_id != second.analysis_id
+
+    def test_parse_all_shares_asts_between_analyzers(self):
+        """Test that analyze feeds both analyzers from one parse."""
+        analyzer = PatternAnalyzer()
+        queries = [
+            QueryLog(sql="SELECT * FROM users CROSS JOIN orders", duration_ms=2.0),
+            QueryLog(sql="UPDATE users SET name = 'x' WHERE id = 1", duration_ms=1.0),
+        ]
+        parsed = analyzer.parse_all(queries)
+        assert [query for query, _ in parsed] == queries
+
+        result = analyzer.analyze(queries)
+        assert len(result.join_patterns) == 1
+        assert {mp.table for mp in result.mutation_patterns} == {"users", "orders"}
+        assert analyzer.mutation_analyzer.queries_processed == 2
+
+    def test_access_pattern_ratios_stored(self):
+        """Test that access pattern ratios are computed on construction."""
+        ap = AccessPattern(
+            table_a="users",
+            table_b="orders",
+            co_access_count=6,
+            table_a_solo_count=4,
+            table_b_solo_count=0,
+        )
+
+        assert ap.table_pair == ("orders", "users")
+        assert ap.co_access_ratio == pytest.approx(1.0)
+        assert ap.table_a_independence == pytest.approx(0.4)
+        assert ap.table_b_independence == pytest.approx(0.0)
+
+    def test_embedding_recommendations_top_k(self):
+        """Test that top_k returns the head of the full ranking."""
+        analyzer = PatternAnalyzer()
+        queries = [
+            QueryLog(sql="SELECT * FROM users CROSS JOIN orders", duration_ms=1.0),
+            QueryLog(sql="SELECT * FROM orders CROSS JOIN items", duration_ms=1.0),
+            QueryLog(sql="SELECT * FROM users", duration_ms=1.0),
+        ]
+        result = analyzer.analyze(queries)
+
+        everything = analyzer.get_embedding_recommendations(result)
+        top = analyzer.get_embedding_recommendations(result, top_k=1)
+        assert len(everything) == 2
+        assert top == everything[:1]
+
+    def test_embedding_recommendations_memoized_per_result(self):
+        """Test that repeated calls reuse evaluations for the same result."""
+        analyzer = PatternAnalyzer()
+        result = analyzer.analyze([
+            QueryLog(sql="SELECT * FROM users CROSS JOIN orders", duration_ms=1.0),
+        ])
+
+        first = analyzer.get_embedding_recommendations(result)
+        second = analyzer.get_embedding_recommendations(result)
+        assert first == second
+        assert first[0] is second[0]
+
+        bounded = analyzer.get_embedding_recommendations(
+            result, cardinality_info={("users", "orders"): {"max": 5000}}
+        )
+        assert bounded[0] is not first[0]
+        assert bounded[0]["decision"] == "REFERENCE"
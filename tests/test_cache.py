@@ -439,6 +439,18 @@ class TestRecommendationCache:
         assert "hash_a" in hashes
         assert "hash_b" in hashes
 
+    def test_count(self, cache_dir, sample_recommendations):
+        """Should count entries without listing them."""
+        cache = RecommendationCache(cache_dir)
+        assert cache.count() == 0
+
+        cache.put("hash_a", sample_recommendations)
+        cache.put("hash_b", sample_recommendations)
+        assert cache.count() == 2
+
+        cache.invalidate_all()
+        assert cache.count() == 0
+
     def test_version_mismatch_invalidates(self, cache_dir, sample_recommendations):
         """Cache entry with different version should be invalidated."""
         cache = RecommendationCache(cache_dir)
@@ -1,10 +1,20 @@
 """Tests for CLI commands and v1.3.0 features."""
 
+import json
+import subprocess
+import sys
+
 import pytest
 from click.testing import CliRunner
 from unittest.mock import patch, MagicMock
 
-from schema_travels.cli.main import cli, _confidence_color, _display_analysis_summary
+from schema_travels.cli.main import cli
+from schema_travels.cli._recs import normalize_recs
+from schema_travels.cli.cmd_analyze import (
+    _confidence_color,
+    _display_analysis_summary,
+    _write_json,
+)
 from schema_travels.recommender.models import SchemaRecommendation, RelationshipDecision
 
 
@@ -86,6 +96,100 @@ class TestConfidenceColor:
         assert _confidence_color(0.6999) == "red"
 
 
+# =============================================================================
+# TestNormalizeRecs
+# =============================================================================
+
+class TestNormalizeRecs:
+    """Tests for normalize_recs boundary conversion."""
+
+    def test_dicts_become_schema_recommendations(self):
+        """Test that stored dict recommendations are converted."""
+        views = normalize_recs([
+            {
+                "parent_table": "users",
+                "child_table": "orders",
+                "decision": "EMBED",
+                "confidence": 0.9,
+                "reasoning": ["High co-access"],
+            },
+        ])
+        assert views[0].rec.decision == RelationshipDecision.EMBED
+        assert views[0].rec.warnings == []
+        assert views[0].label == "EMBED"
+
+    def test_unknown_decision_defaults_to_reference(self):
+        """Test that unrecognized decisions are saved as REFERENCE but keep their label."""
+        views = normalize_recs([{"parent_table": "a", "child_table": "b", "decision": "EVALUATE"}])
+        assert views[0].rec.decision == RelationshipDecision.REFERENCE
+        assert views[0].label == "EVALUATE"
+
+    def test_missing_dict_confidence(self):
+        """Test a missing confidence is saved as 0.5 but filtered as 0."""
+        views = normalize_recs([{"parent_table": "a", "child_table": "b", "decision": "embed"}])
+        assert views[0].rec.confidence == 0.5
+        assert views[0].confidence == 0
+
+    def test_objects_with_string_decisions_are_converted(self):
+        """Test that attribute-style recommendations are converted."""
+        rec = MagicMock(spec=["parent_table", "child_table", "decision"])
+        rec.parent_table, rec.child_table, rec.decision = "users", "orders", "Separate"
+        views = normalize_recs([rec])
+        assert views[0].rec.decision == RelationshipDecision.SEPARATE
+        assert views[0].rec.confidence == 0.5
+        assert views[0].rec.reasoning == []
+        assert views[0].label == "SEPARATE"
+
+    def test_schema_recommendations_pass_through(self, mock_recommendations):
+        """Test that SchemaRecommendation objects are wrapped unchanged."""
+        views = normalize_recs(mock_recommendations)
+        assert all(v.rec is r for v, r in zip(views, mock_recommendations, strict=True))
+
+
+# =============================================================================
+# TestWriteJson
+# =============================================================================
+
+class TestWriteJson:
+    """Tests for _write_json output helper."""
+
+    def test_round_trip(self, tmp_path):
+        """Test that written JSON loads back unchanged."""
+        data = {"analysis_id": "abc", "items": [1, 2.5, "x", None]}
+        path = tmp_path / "out.json"
+        _write_json(path, data)
+        assert json.loads(path.read_text()) == data
+
+    def test_stdlib_fallback(self, tmp_path, monkeypatch):
+        """Test that output falls back to stdlib json without orjson."""
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        path = tmp_path / "out.json"
+        _write_json(path, {"a": [1, 2]})
+        assert json.loads(path.read_text()) == {"a": [1, 2]}
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_compact_utf8_output(self, tmp_path, monkeypatch, use_orjson):
+        """Test that compact output has no whitespace and keeps non-ASCII text."""
+        if not use_orjson:
+            monkeypatch.setitem(sys.modules, "orjson", None)
+        path = tmp_path / "out.json"
+        _write_json(path, {"table": "bestellungen_größe", "n": [1, 2]}, compact=True)
+        assert path.read_text(encoding="utf-8") == '{"table":"bestellungen_größe","n":[1,2]}'
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_objects_serialized_via_to_dict(
+        self, tmp_path, monkeypatch, mock_recommendations, use_orjson
+    ):
+        """Test that model objects are written through their to_dict()."""
+        if not use_orjson:
+            monkeypatch.setitem(sys.modules, "orjson", None)
+        path = tmp_path / "out.json"
+        _write_json(path, {"recommendations": mock_recommendations})
+        assert json.loads(path.read_text()) == {
+            "recommendations": [r.to_dict() for r in mock_recommendations]
+        }
+
+
 # =============================================================================
 # TestCLIHelp
 # =============================================================================
@@ -93,6 +197,29 @@ class TestConfidenceColor:
 class TestCLIHelp:
     """Tests for CLI help text includes new flags."""
 
+    def test_group_help_lists_lazy_commands(self, cli_runner):
+        """Test that lazily loaded subcommands appear in the group help."""
+        result = cli_runner.invoke(cli, ["--help"])
+        assert result.exit_code == 0
+        for name in ("analyze", "clear-cache", "config", "delete", "history", "report", "simulate"):
+            assert name in result.output
+
+    def test_group_help_skips_heavy_imports(self):
+        """Test that top-level --help loads neither settings nor sqlglot."""
+        code = (
+            "import sys\n"
+            "from schema_travels.cli.main import cli\n"
+            "try:\n"
+            "    cli(['--help'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print(sorted(m for m in ('pydantic', 'sqlglot', 'rich') if m in sys.modules))\n"
+        )
+        proc = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert proc.stdout.strip().splitlines()[-1] == "[]"
+
     def test_analyze_help_shows_min_confidence(self, cli_runner):
         """Test that --min-confidence appears in help."""
         result = cli_runner.invoke(cli, ["analyze", "--help"])
@@ -219,6 +346,41 @@ class TestDisplayAnalysisSummary:
         assert "Query Examples" not in captured.out
         assert "findOne" not in captured.out
 
+    def test_rule_based_evaluate_decision_is_shown(
+        self, mock_result, mock_target_schema, capsys
+    ):
+        """Test that EVALUATE decisions are displayed as EVALUATE."""
+        _display_analysis_summary(
+            mock_result,
+            [{
+                "parent_table": "users",
+                "child_table": "orders",
+                "decision": "EVALUATE",
+                "confidence": 0.5,
+                "reasoning": ["Mixed signals - manual review recommended"],
+            }],
+            mock_target_schema,
+        )
+        captured = capsys.readouterr()
+        assert "EVALUATE" in captured.out
+        assert "REFERENCE" not in captured.out
+
+    def test_display_top_limits_rows(
+        self, mock_result, mock_recommendations, mock_target_schema, capsys
+    ):
+        """Test that display_top caps the rows shown per table."""
+        _display_analysis_summary(
+            mock_result,
+            mock_recommendations,
+            mock_target_schema,
+            display_top=1,
+        )
+        captured = capsys.readouterr()
+        rec = mock_recommendations[0]
+        assert f"{rec.parent_table} → {rec.child_table}" in captured.out
+        for rec in mock_recommendations[1:]:
+            assert f"{rec.parent_table} → {rec.child_table}" not in captured.out
+
 
 # =============================================================================
 # TestCLIVersion
@@ -232,3 +394,77 @@ class TestCLIVersion:
         result = cli_runner.invoke(cli, ["--version"])
         assert result.exit_code == 0
         assert "1.3.0" in result.output or "version" in result.output.lower()
+
+
+# =============================================================================
+# TestAnalyzePersistence
+# =============================================================================
+
+class TestAnalyzePersistence:
+    """Tests for how analyze records runs in the database."""
+
+    @pytest.fixture
+    def isolated_db(self, temp_dir, monkeypatch):
+        """Point settings, repository and cache at a temporary directory."""
+        from schema_travels.config import get_settings
+        from schema_travels.persistence import get_repository
+        from schema_travels.recommender.cache import get_cache
+
+        monkeypatch.setenv("DATABASE_PATH", str(temp_dir / "test.db"))
+        factories = (get_settings, get_repository, get_cache)
+        for factory in factories:
+            factory.cache_clear()
+        yield get_repository
+        for factory in factories:
+            factory.cache_clear()
+
+    @pytest.fixture
+    def analyze_args(self, temp_dir, sample_schema_sql, sample_postgres_log):
+        """Arguments for a rule-based analyze run on sample inputs."""
+        logs_dir = temp_dir / "logs"
+        logs_dir.mkdir()
+        (logs_dir / "postgresql.log").write_text(sample_postgres_log)
+        schema_file = temp_dir / "schema.sql"
+        schema_file.write_text(sample_schema_sql)
+        return [
+            "analyze", "--logs-dir", str(logs_dir),
+            "--schema-file", str(schema_file), "--no-ai",
+        ]
+
+    def test_successful_run_is_completed(self, cli_runner, isolated_db, analyze_args):
+        """Test that a successful run is stored as completed."""
+        result = cli_runner.invoke(cli, analyze_args)
+        assert result.exit_code == 0, result.output
+
+        [analysis] = isolated_db().list_analyses()
+        assert analysis["status"] == "completed"
+
+    def test_failure_before_saving_is_recorded(self, cli_runner, isolated_db, analyze_args):
+        """Test that a run failing before its results are saved is marked failed."""
+        with patch(
+            "schema_travels.recommender.SchemaGenerator.generate",
+            side_effect=RuntimeError("boom"),
+        ):
+            result = cli_runner.invoke(cli, analyze_args)
+        assert result.exit_code == 1
+
+        [analysis] = isolated_db().list_analyses()
+        assert analysis["status"] == "failed"
+        assert isolated_db().get_analysis_result(analysis["id"]) is None
+
+    def test_no_cache_skips_hashing_and_storing(
+        self, cli_runner, isolated_db, analyze_args, mock_recommendations, monkeypatch
+    ):
+        """Test that --no-cache neither hashes the inputs nor caches the result."""
+        from schema_travels.recommender.cache import get_cache
+
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-api-key")
+        with patch("schema_travels.recommender.ClaudeAdvisor") as advisor, patch(
+            "schema_travels.recommender.cache.compute_input_hash"
+        ) as compute_hash:
+            advisor.return_value.get_recommendations.return_value = mock_recommendations
+            result = cli_runner.invoke(cli, analyze_args[:-1] + ["--no-cache"])
+
+        assert result.exit_code == 0, result.output
+        compute_hash.assert_not_called()
+        assert get_cache().list_entries() == []
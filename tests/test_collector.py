@@ -1,12 +1,29 @@
 """Tests for collector module."""
 
+import dataclasses
+import pickle
+
 import pytest
+import sqlglot
+from sqlglot import exp
 from pathlib import Path
 from datetime import datetime
 
-from schema_travels.collector.models import QueryLog, QueryType
+from schema_travels.collector.models import (
+    ColumnDefinition,
+    ForeignKeyDefinition,
+    QueryLog,
+    QueryType,
+    SchemaDefinition,
+    TableDefinition,
+)
 from schema_travels.collector.schema_parser import SchemaParser
-from schema_travels.collector.log_parser import PostgresLogParser, MySQLLogParser
+from schema_travels.collector.log_parser import (
+    MySQLLogParser,
+    PostgresLogParser,
+    _parse_pg_timestamp,
+    _PgEntry,
+)
 
 
 class TestQueryLog:
@@ -32,6 +49,17 @@ class TestQueryLog:
         log = QueryLog(sql="DELETE FROM users WHERE id = 1")
         assert log.query_type == QueryType.DELETE
 
+    @pytest.mark.parametrize("sql, expected", [
+        ("\n\t  delete FROM users", QueryType.DELETE),
+        ("(SELECT 1) UNION (SELECT 2)", QueryType.SELECT),
+        ("SELECTED", QueryType.SELECT),
+        ("WITH x AS (SELECT 1) SELECT * FROM x", QueryType.OTHER),
+        ("", QueryType.OTHER),
+    ])
+    def test_query_type_leading_keyword(self, sql, expected):
+        """Test the type comes from the first keyword after whitespace or parentheses."""
+        assert QueryLog(sql=sql).query_type == expected
+
     def test_sql_normalization(self):
         """Test SQL normalization replaces literals."""
         log = QueryLog(sql="SELECT * FROM users WHERE id = 123 AND name = 'test'")
@@ -39,6 +67,96 @@ class TestQueryLog:
         assert "123" not in log.normalized_sql
         assert "'test'" not in log.normalized_sql
 
+    def test_derived_fields_are_lazy(self):
+        """Test query type and normalized SQL are computed on first access."""
+        log = QueryLog(sql="  select id FROM users WHERE id = 7")
+        assert log._query_type is None
+        assert log._normalized_sql is None
+
+        assert log.query_type == QueryType.SELECT
+        assert log.normalized_sql == "select id FROM users WHERE id = ?"
+        assert log._query_type is QueryType.SELECT
+
+    def test_derived_fields_can_be_supplied(self):
+        """Test query type and normalized SQL passed in or assigned are kept."""
+        log = QueryLog(
+            sql="SELECT 1", query_type=QueryType.OTHER, normalized_sql="custom"
+        )
+        assert log.query_type == QueryType.OTHER
+        assert log.normalized_sql == "custom"
+
+        log.query_type = QueryType.SELECT
+        log.normalized_sql = "SELECT ?"
+        assert log.query_type == QueryType.SELECT
+        assert log.normalized_sql == "SELECT ?"
+
+    def test_asdict_and_repr_use_public_names(self):
+        """Test the derived-value slots stay out of asdict and repr shows query_type."""
+        log = QueryLog(sql="SELECT 1")
+
+        assert "_query_type" not in dataclasses.asdict(log)
+        assert "query_type=<QueryType.SELECT" in repr(log)
+
+    def test_pickle_round_trip(self):
+        """Test slotted query logs survive pickling for worker processes."""
+        log = QueryLog(sql="SELECT 1", user="app")
+        assert log.normalized_sql == "SELECT ?"
+
+        restored = pickle.loads(pickle.dumps(log))
+
+        assert restored == log
+        assert restored.normalized_sql == "SELECT ?"
+
+    def test_sql_normalization_whitespace(self):
+        """Test normalization collapses whitespace outside of literals."""
+        log = QueryLog(sql="  SELECT *\n\tFROM t1  WHERE a = 'x  y'\nAND b=42 ")
+        assert log.normalized_sql == "SELECT * FROM t1 WHERE a = '?' AND b=?"
+
+
+class TestSchemaDefinition:
+    """Tests for SchemaDefinition and TableDefinition lookups."""
+
+    def test_get_table_and_column(self):
+        """Test lookups are case-insensitive and the first match wins."""
+        users = TableDefinition(
+            name="Users",
+            columns=[ColumnDefinition("ID", "INT"), ColumnDefinition("id", "TEXT")],
+        )
+        schema = SchemaDefinition(tables=[users, TableDefinition(name="users")])
+
+        assert schema.get_table("USERS") is users
+        assert schema.get_table("orders") is None
+        assert users.get_column("id").data_type == "INT"
+        assert users.get_column("email") is None
+
+    def test_get_relationships(self):
+        """Test foreign keys are found from either side, once each, in order."""
+        fks = [
+            ForeignKeyDefinition("fk1", "Orders", ["user_id"], "users", ["id"]),
+            ForeignKeyDefinition("fk2", "users", ["manager_id"], "USERS", ["id"]),
+            ForeignKeyDefinition("fk3", "items", ["order_id"], "orders", ["id"]),
+        ]
+        schema = SchemaDefinition(foreign_keys=fks)
+
+        assert schema.get_relationships("users") == fks[:2]
+        assert schema.get_relationships("ORDERS") == [fks[0], fks[2]]
+        assert schema.get_relationships("products") == []
+
+    def test_reset_indexes(self):
+        """Test lookups see tables and columns added after reset_indexes()."""
+        table = TableDefinition(name="users")
+        schema = SchemaDefinition(tables=[table])
+        assert schema.get_table("orders") is None
+        assert table.get_column("email") is None
+
+        schema.tables.append(TableDefinition(name="orders"))
+        table.columns.append(ColumnDefinition("email", "TEXT"))
+        schema.reset_indexes()
+        table.reset_indexes()
+
+        assert schema.get_table("orders") is not None
+        assert table.get_column("email") is not None
+
 
 class TestSchemaParser:
     """Tests for SchemaParser."""
@@ -62,6 +180,39 @@ class TestSchemaParser:
         # Name should be 'users' or at least non-empty after fix
         assert len(table.columns) == 3 or table.name == "users"
 
+    def test_parse_file_is_cached_until_changed(self, tmp_path):
+        """Test repeated parses reuse the cache but return separate copies."""
+        schema_file = tmp_path / "schema.sql"
+        schema_file.write_text("CREATE TABLE users (id INT PRIMARY KEY);")
+        parser = SchemaParser()
+
+        first = parser.parse_file(schema_file)
+        second = parser.parse_file(schema_file)
+        assert first == second
+        assert first is not second
+        first.tables.clear()
+        assert len(parser.parse_file(schema_file).tables) == 1
+
+        schema_file.write_text(
+            "CREATE TABLE users (id INT PRIMARY KEY);\n"
+            "CREATE TABLE orders (id INT PRIMARY KEY);"
+        )
+        assert len(parser.parse_file(schema_file).tables) == 2
+
+    def test_parse_files_with_workers(self, tmp_path):
+        """Test parsing several files in worker processes keeps their order."""
+        paths = []
+        for name in ("users", "orders", "items"):
+            path = tmp_path / f"{name}.sql"
+            path.write_text(f"CREATE TABLE {name} (id INT PRIMARY KEY);")
+            paths.append(path)
+        parser = SchemaParser()
+
+        schemas = parser.parse_files(paths, workers=2)
+
+        assert [s.tables[0].name for s in schemas] == ["users", "orders", "items"]
+        assert schemas == parser.parse_files(paths)
+
     def test_parse_foreign_key(self):
         """Test parsing foreign key relationships."""
         sql = """
@@ -103,6 +254,38 @@ class TestSchemaParser:
         # Should have 4 columns
         assert len(table.columns) >= 3
 
+    @pytest.mark.parametrize("node, expected", [
+        (exp.to_table("public.users"), "users"),
+        (sqlglot.parse_one("CREATE TABLE orders (id INT)").this, "orders"),
+        (exp.Reference(this=exp.to_table("items")), "items"),
+        (None, ""),
+    ])
+    def test_get_table_name(self, node, expected):
+        """Test table names are found on tables, schemas and wrapping nodes."""
+        assert SchemaParser()._get_table_name(node) == expected
+
+    @pytest.mark.parametrize("dialect", ["postgres", "mysql"])
+    def test_column_types_and_defaults_render_as_sql(self, dialect):
+        """Test that types use the parser dialect and defaults render as str() would."""
+        sql = """
+        CREATE TABLE products (
+            price DECIMAL(10,2) DEFAULT 0.00,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+        """
+        statement = sqlglot.parse_one(sql, dialect=dialect)
+        expected = {
+            col.name: (
+                col.args["kind"].sql(dialect=dialect),
+                str(col.find(exp.DefaultColumnConstraint).this),
+            )
+            for col in statement.find_all(exp.ColumnDef)
+        }
+
+        table = SchemaParser(dialect).parse_sql(sql).tables[0]
+
+        assert {c.name: (c.data_type, c.default) for c in table.columns} == expected
+
     def test_regex_fallback(self):
         """Test that regex fallback works when sqlglot fails."""
         # This SQL is intentionally formatted to test regex parsing
@@ -114,6 +297,40 @@ class TestSchemaParser:
         assert schema is not None
         assert len(schema.tables) >= 0
 
+    def test_regex_fallback_delimits_column_lists(self):
+        """Test the fallback scanner ignores parentheses and commas in quotes and comments."""
+        sql = """
+        CREATE TABLE IF NOT EXISTS `orders` (
+            id INT PRIMARY KEY,  -- note (unbalanced
+            total DECIMAL(10, 2) NOT NULL,
+            label VARCHAR(20) DEFAULT 'a, b)',
+            /* user (owner), required */
+            user_id INT REFERENCES users(id)
+        ) ENGINE=InnoDB;
+        CREATE TABLE users (id INT PRIMARY KEY);
+        CREATE TABLE broken (id INT
+        """
+        schema = SchemaParser()._parse_with_regex(sql)
+
+        assert [t.name for t in schema.tables] == ["orders", "users"]
+        orders = schema.tables[0]
+        assert [c.name for c in orders.columns] == ["id", "total", "label", "user_id"]
+        assert orders.get_column("total").data_type == "DECIMAL(10, 2)"
+        assert orders.primary_key == ["id"]
+        assert [(fk.from_table, fk.to_table) for fk in schema.foreign_keys] == [
+            ("orders", "users"),
+        ]
+
+    def test_regex_fallback_skips_only_unterminated_table(self):
+        """Test an unterminated column list does not drop the tables after it."""
+        sql = """
+        CREATE TABLE broken (id INT, name VARCHAR(10);
+        CREATE TABLE users (id INT PRIMARY KEY);
+        """
+        schema = SchemaParser()._parse_with_regex(sql)
+
+        assert [t.name for t in schema.tables] == ["users"]
+
 
 class TestPostgresLogParser:
     """Tests for PostgresLogParser."""
@@ -147,6 +364,113 @@ class TestPostgresLogParser:
 
         assert len(queries) >= 0  # May be 0 if parsing is strict
 
+    def test_parse_skips_non_statement_entries(self, tmp_path):
+        """Test entries are skipped only when no line carries a statement."""
+        log_file = tmp_path / "postgresql.log"
+        log_file.write_text(
+            "2024-01-15 10:30:45.100 UTC [1] LOG:  checkpoint starting: time\n"
+            "    SELECT this is not a statement\n"
+            "2024-01-15 10:30:45.123 UTC [2] app@shop LOG:  statement: SELECT *\n"
+            "    FROM users WHERE id = 1\n"
+            "2024-01-15 10:30:45.125 UTC [2] app@shop LOG:  duration: 2.345 ms\n"
+            "2024-01-15 10:30:46.000 UTC [3] app@shop LOG:  duration: 1.5 ms  "
+            "statement: DELETE FROM carts\n"
+            "2024-01-15 10:30:47.000 UTC [4] app@shop LOG:  duration: 2.5 ms\n"
+            "\tstatement: SELECT * FROM orders\n"
+        )
+
+        queries = list(PostgresLogParser(tmp_path).parse_file(log_file))
+
+        assert [q.sql for q in queries] == [
+            "SELECT * FROM users WHERE id = 1",
+            "DELETE FROM carts",
+            "SELECT * FROM orders",
+        ]
+        assert queries[0].user == "app"
+        assert queries[1].duration_ms == 1.5
+        assert queries[2].duration_ms == 2.5
+
+    def test_get_log_files_lists_each_file_once(self, tmp_path):
+        """Test files matching several patterns are returned once, dotfiles never."""
+        for name in ("postgresql-2024.log", "app.log", "notes.txt", ".app.log"):
+            (tmp_path / name).write_text("")
+        (tmp_path / "archive.log").mkdir()
+
+        files = PostgresLogParser(tmp_path).get_log_files()
+
+        assert [f.name for f in files] == ["app.log", "postgresql-2024.log"]
+
+    def test_parse_with_workers(self, tmp_path):
+        """Test parsing files in worker processes keeps file order."""
+        for i in range(3):
+            (tmp_path / f"node{i}.log").write_text(
+                f"2024-01-15 10:30:4{i}.000 UTC [1] app@shop LOG:  "
+                f"statement: SELECT * FROM t{i}\n"
+            )
+        parser = PostgresLogParser(tmp_path)
+
+        assert [q.sql for q in parser.parse(workers=2)] == [q.sql for q in parser.parse()]
+        assert [q.sql for q in parser.parse(workers=2)] == [
+            "SELECT * FROM t0", "SELECT * FROM t1", "SELECT * FROM t2",
+        ]
+
+    def test_parse_interns_user_and_database(self, tmp_path):
+        """Test queries from the same user and database share string objects."""
+        (tmp_path / "node.log").write_text(
+            "2024-01-15 10:30:45.000 UTC [1] app@shop LOG:  statement: SELECT 1\n"
+            "2024-01-15 10:30:46.000 UTC [2] app@shop LOG:  statement: SELECT 2\n"
+        )
+
+        first, second = PostgresLogParser(tmp_path).parse()
+
+        assert first.user is second.user
+        assert first.database is second.database
+
+    def test_iter_parse_streams(self, tmp_path):
+        """Test iter_parse yields the same queries as parse, lazily."""
+        (tmp_path / "node.log").write_text(
+            "2024-01-15 10:30:45.000 UTC [1] app@shop LOG:  statement: SELECT 1\n"
+            "2024-01-15 10:30:46.000 UTC [1] app@shop LOG:  statement: SELECT 2\n"
+        )
+        parser = PostgresLogParser(tmp_path)
+
+        stream = parser.iter_parse()
+        assert next(stream).sql == "SELECT 1"
+        assert [q.sql for q in parser.iter_parse()] == [q.sql for q in parser.parse()]
+
+    @pytest.mark.parametrize("line", [
+        "2024-01-15 10:30:45.123 UTC [12345] app@ecommerce LOG:  statement: SELECT 1",
+        "2024-01-15 10:30:45 [1] ERROR:  relation does not exist",
+        "2024-01-15  10:30:45 UTC [1] LOG:  double space after date",
+        "2024-01-15 10:30:45 UTC [1] 1app@db LOG:  user starting with a digit",
+        "2024-01-15 10:30:45 UTC [1] LOG:",
+        "    AND status = 'active'",
+        "",
+    ])
+    def test_match_line_agrees_with_regex(self, tmp_path, line):
+        """Test the prefix scanner yields the same fields as LOG_LINE_PATTERN."""
+        parser = PostgresLogParser(tmp_path)
+        match = PostgresLogParser.LOG_LINE_PATTERN.match(line)
+
+        expected = _PgEntry(**match.groupdict()) if match else None
+        assert parser._match_line(line) == expected
+
+
+class TestParsePgTimestamp:
+    """Tests for the PostgreSQL timestamp parser."""
+
+    @pytest.mark.parametrize("ts_str, expected", [
+        ("2024-01-15 10:30:45", datetime(2024, 1, 15, 10, 30, 45)),
+        ("2024-01-15 10:30:45.123", datetime(2024, 1, 15, 10, 30, 45, 123000)),
+        ("2024-01-15  10:30:45.1234567", datetime(2024, 1, 15, 10, 30, 45, 123456)),
+        ("2024-02-30 10:30:45", None),
+        ("2024-01-15 10:30:45,123", None),
+        ("2024-01-15", None),
+    ])
+    def test_parse(self, ts_str, expected):
+        """Test valid timestamps are parsed and invalid ones return None."""
+        assert _parse_pg_timestamp(ts_str) == expected
+
 
 class TestMySQLLogParser:
     """Tests for MySQLLogParser."""
@@ -177,3 +501,29 @@ class TestMySQLLogParser:
 
         # Parser should find at least one query
         assert isinstance(queries, list)
+
+    def test_parse_slow_query_log_entries(self, tmp_path):
+        """Test header fields and SQL are collected per entry."""
+        log_file = tmp_path / "slow.log"
+        log_file.write_text(
+            "# Time: 2024-01-15T10:30:45.123456Z\n"
+            "# User@Host: app[app] @ localhost []\n"
+            "# Query_time: 0.002000  Lock_time: 0.000000 Rows_sent: 3  Rows_examined: 9\n"
+            "SET timestamp=1705314645;\n"
+            "SELECT * FROM users\n"
+            "WHERE id = 1;\n"
+            "#Time: 2024-01-15T10:30:46Z\n"
+            "# some other comment\n"
+            "UPDATE users SET name = 'x' WHERE id = 2;\n"
+        )
+
+        queries = list(MySQLLogParser(tmp_path).parse_file(log_file))
+
+        assert [q.sql for q in queries] == [
+            "SELECT * FROM users WHERE id = 1",
+            "UPDATE users SET name = 'x' WHERE id = 2",
+        ]
+        assert queries[0].user == "app"
+        assert queries[0].duration_ms == pytest.approx(2.0)
+        assert queries[0].rows_affected == 3
+        assert queries[1].timestamp == datetime(2024, 1, 15, 10, 30, 46)
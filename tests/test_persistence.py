@@ -0,0 +1,198 @@
+"""Tests for the persistence module."""
+
+import pytest
+
+from schema_travels.analyzer.models import AnalysisResult
+
+
+class TestAnalysisRepository:
+    """Tests for AnalysisRepository."""
+
+    def test_transaction_commits_grouped_writes(self, test_repository):
+        """Test that writes inside a transaction are all committed."""
+        test_repository.create_analysis("abc12345", "postgres", "mongodb")
+
+        with test_repository.transaction():
+            test_repository.save_analysis_result(
+                AnalysisResult(analysis_id="abc12345", total_queries_analyzed=7)
+            )
+            test_repository.save_recommendations("abc12345", [])
+
+        analysis = test_repository.get_analysis("abc12345")
+        assert analysis["status"] == "completed"
+        assert analysis["total_queries"] == 7
+        assert test_repository.get_analysis_result("abc12345") is not None
+
+    def test_transaction_rolls_back_on_error(self, test_repository):
+        """Test that a failing transaction leaves no partial writes."""
+        test_repository.create_analysis("abc12345", "postgres", "mongodb")
+
+        with pytest.raises(RuntimeError), test_repository.transaction():
+            test_repository.save_analysis_result(
+                AnalysisResult(analysis_id="abc12345")
+            )
+            raise RuntimeError("boom")
+
+        assert test_repository.get_analysis("abc12345")["status"] != "completed"
+        assert test_repository.get_analysis_result("abc12345") is None
+
+        # Writes after the failed transaction commit on their own again
+        test_repository.update_analysis_status("abc12345", "failed")
+        assert test_repository.get_analysis("abc12345")["status"] == "failed"
+
+    def test_large_json_is_stored_compressed(self, test_repository):
+        """Test long JSON payloads round-trip through compressed BLOBs."""
+        from schema_travels.recommender.models import (
+            RelationshipDecision,
+            SchemaRecommendation,
+        )
+
+        reasoning = [f"users is read with orders in query {i}" for i in range(100)]
+        test_repository.create_analysis("abc12345", "postgres", "mongodb")
+        test_repository.save_recommendations("abc12345", [
+            SchemaRecommendation(
+                "users", "orders", RelationshipDecision.EMBED, 0.9, reasoning
+            ),
+        ])
+
+        row = test_repository.db.fetch_one(
+            "SELECT reasoning_json, warnings_json FROM recommendations"
+        )
+        assert isinstance(row["reasoning_json"], bytes)
+        assert row["warnings_json"] == "[]"
+        assert test_repository.get_recommendations("abc12345")[0]["reasoning"] == reasoning
+
+    def test_reads_uncompressed_json(self, test_repository):
+        """Test rows written as plain TEXT JSON are still readable."""
+        test_repository.create_analysis("abc12345", "postgres", "mongodb")
+        test_repository.db.execute(
+            "INSERT INTO target_schemas (analysis_id, target_type, schema_json)"
+            " VALUES (?, ?, ?)",
+            ("abc12345", "mongodb", '{"collections": []}'),
+        )
+
+        assert test_repository.get_target_schema("abc12345") == {"collections": []}
+
+
+class TestDatabase:
+    """Tests for Database connection handling."""
+
+    def test_reuses_connection_until_closed(self, test_database):
+        """Test operations share one connection and close() reopens it."""
+        with test_database.connection() as first:
+            pass
+        with test_database.connection() as second:
+            pass
+        assert first is second
+
+        test_database.close()
+        with test_database.connection() as reopened:
+            assert reopened is not first
+            assert reopened.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_close_closes_other_threads_connections(self, test_database):
+        """Test close() also closes connections opened by other threads."""
+        import sqlite3
+        import threading
+
+        opened = []
+
+        def worker():
+            with test_database.connection() as conn:
+                opened.append(conn)
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        test_database.close()
+        with pytest.raises(sqlite3.ProgrammingError):
+            opened[0].execute("SELECT 1")
+
+    @pytest.mark.parametrize("in_transaction", [False, True])
+    def test_clear_all(self, test_repository, in_transaction):
+        """Test clear_all empties the tables, alone or inside a transaction."""
+        db = test_repository.db
+        test_repository.create_analysis("abc12345", "postgres", "mongodb")
+
+        if in_transaction:
+            with pytest.raises(RuntimeError), db.transaction():
+                db.clear_all()
+                raise RuntimeError("boom")
+            assert test_repository.get_analysis("abc12345") is not None
+
+        db.clear_all()
+        assert test_repository.get_analysis("abc12345") is None
+
+    def test_migrates_indexes_from_version_1(self, temp_dir):
+        """Test opening a version 1 database adds the composite indexes."""
+        import sqlite3
+
+        from schema_travels.persistence.database import Database
+
+        db_path = temp_dir / "v1.db"
+        conn = sqlite3.connect(db_path)
+        conn.executescript(
+            "CREATE TABLE recommendations (id INTEGER PRIMARY KEY, analysis_id TEXT,"
+            " parent_table TEXT, child_table TEXT, decision TEXT, confidence REAL,"
+            " reasoning_json TEXT, warnings_json TEXT);"
+            "CREATE INDEX idx_recommendations_analysis ON recommendations(analysis_id);"
+            "CREATE TABLE schema_version (version INTEGER PRIMARY KEY);"
+            "INSERT INTO schema_version VALUES (1);"
+        )
+        conn.close()
+
+        db = Database(db_path)
+        try:
+            indexes = {
+                row["name"]
+                for row in db.fetch_all("SELECT name FROM sqlite_master WHERE type = 'index'")
+            }
+            assert {"idx_recommendations_parent", "idx_simulations_analysis_created"} <= indexes
+            assert "idx_recommendations_analysis" not in indexes
+            assert db.fetch_one("SELECT MAX(version) AS v FROM schema_version")["v"] == 2
+
+            plan = db.fetch_all(
+                "EXPLAIN QUERY PLAN SELECT * FROM simulations"
+                " WHERE analysis_id = ? ORDER BY created_at DESC",
+                ("abc12345",),
+            )
+            detail = " ".join(row["detail"] for row in plan)
+            assert "idx_simulations_analysis_created" in detail
+            assert "TEMP B-TREE" not in detail
+        finally:
+            db.close()
+
+    def test_in_memory_database_keeps_schema(self):
+        """Test an in-memory database survives across operations."""
+        from schema_travels.persistence.database import Database
+
+        db = Database(":memory:")
+        try:
+            db.execute(
+                "INSERT INTO analyses (id, source_db_type, target_db_type) VALUES (?, ?, ?)",
+                ("abc12345", "postgres", "mongodb"),
+            )
+            assert db.fetch_one("SELECT id FROM analyses")["id"] == "abc12345"
+        finally:
+            db.close()
+
+
+class TestGetRepository:
+    """Tests for the cached repository factory."""
+
+    def test_returns_one_instance_per_process(self, temp_dir, monkeypatch):
+        """Test that repeated calls reuse the same repository."""
+        from schema_travels.config import get_settings
+        from schema_travels.persistence import get_repository
+
+        monkeypatch.setenv("DATABASE_PATH", str(temp_dir / "repo.db"))
+        get_settings.cache_clear()
+        get_repository.cache_clear()
+        try:
+            repo = get_repository()
+            assert get_repository() is repo
+            assert repo.db.db_path == temp_dir / "repo.db"
+        finally:
+            get_settings.cache_clear()
+            get_repository.cache_clear()